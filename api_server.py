@@ -10,8 +10,9 @@ import json
 import random
 import html
 import ipaddress
+from array import array
 from datetime import date, datetime
-from collections import deque
+from itertools import accumulate
 from flask import Flask, jsonify, request, send_from_directory, Response
 from flask_cors import CORS
 
@@ -21,6 +22,79 @@ CORS(app)
 DATABASE_PATH = "/app/data/actors.db"
 STATIC_PATH = "/app/actor-game/build"
 
+def find_costar_path(pair_rows, start_id, target_id):
+    """Shortest co-star path between two actors.
+
+    pair_rows are (actor1, actor2, movie_id, title, ...) rows with
+    actor1 < actor2. Returns (actor ids along the path or None, and a dict
+    of (actor1, actor2) -> first (movie_id, title) seen for that pair).
+
+    Actors are remapped to rows 0..n-1 and the co-star lists stored as CSR
+    int arrays, so the BFS frontier, parents and neighbour scans use typed
+    arrays instead of a Python object per queued actor.
+    """
+    edge_movies = {}
+    for a1, a2, movie_id, title, *_ in pair_rows:
+        edge_movies.setdefault((a1, a2), (movie_id, title))
+    
+    # An actor is never their own co-star path; the endpoints answer 404
+    if start_id == target_id:
+        return None, edge_movies
+    
+    ids = sorted({actor_id for pair in edge_movies for actor_id in pair} | {start_id, target_id})
+    row_of = {actor_id: row for row, actor_id in enumerate(ids)}
+    degree = [0] * (len(ids) + 1)
+    for a1, a2 in edge_movies:
+        degree[row_of[a1] + 1] += 1
+        degree[row_of[a2] + 1] += 1
+    indptr = array('i', accumulate(degree))
+    indices = array('i', [0]) * indptr[-1]
+    fill = indptr[:-1]
+    for a1, a2 in edge_movies:
+        u, v = row_of[a1], row_of[a2]
+        indices[fill[u]] = v
+        fill[u] += 1
+        indices[fill[v]] = u
+        fill[v] += 1
+    
+    start, target = row_of[start_id], row_of[target_id]
+    parent = _bfs_parents(indptr, indices, start, target, len(ids))
+    if parent[target] < 0:
+        return None, edge_movies
+    
+    path = [target]
+    while path[-1] != start:
+        path.append(parent[path[-1]])
+    return [ids[row] for row in reversed(path)], edge_movies
+
+def _bfs_parents(indptr, indices, start, target, n):
+    """BFS parent row of every row reached from start (-1 if unreached),
+    stopping as soon as target is reached. Layers are swapped between two
+    array('i') buffers."""
+    parent = array('i', [-1]) * n
+    parent[start] = start
+    frontier = array('i', [start])
+    while frontier and parent[target] < 0:
+        next_frontier = array('i')
+        for current in frontier:
+            for neighbour in indices[indptr[current]:indptr[current + 1]]:
+                if parent[neighbour] < 0:
+                    parent[neighbour] = current
+                    if neighbour == target:
+                        return parent
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    return parent
+
+def actor_details(cursor, actor_ids):
+    """{actor id: (name, profile_path)} for the given actors, in one query"""
+    actor_ids = list(set(actor_ids))
+    if not actor_ids:
+        return {}
+    cursor.execute(f"SELECT id, name, profile_path FROM actors WHERE id IN ({','.join('?' * len(actor_ids))})",
+                   actor_ids)
+    return {actor_id: (name, profile_path) for actor_id, name, profile_path in cursor.fetchall()}
+
 def init_daily_connections_table():
     """Ensure daily_connections table exists"""
     conn = sqlite3.connect(DATABASE_PATH)
@@ -260,52 +334,23 @@ def admin_find_path():
     SELECT m1.actor_id, m2.actor_id, m1.id, m1.title
     FROM movie_credits m1
     JOIN movie_credits m2 ON m1.id = m2.id AND m1.actor_id < m2.actor_id
-    ORDER BY m1.actor_id
     ''')
-    graph = {}
-    edge_movies = {}
-    for a1, a2, mid, title in c.fetchall():
-        graph.setdefault(a1, []).append(a2)
-        graph.setdefault(a2, []).append(a1)
-        key = (a1, a2) if a1 < a2 else (a2, a1)
-        if key not in edge_movies:
-            edge_movies[key] = (mid, title)
+    path_ids, edge_movies = find_costar_path(c.fetchall(), start_id, target_id)
     
-    visited = {start_id: None}
-    q = deque([start_id])
-    found = False
-    while q and not found:
-        cur = q.popleft()
-        for nb in graph.get(cur, []):
-            if nb not in visited:
-                visited[nb] = cur
-                if nb == target_id:
-                    found = True
-                    break
-                q.append(nb)
-    
-    if not found:
+    if path_ids is None:
         conn.close()
         return jsonify({"error": "No path found"}), 404
     
-    path_ids = []
-    node = target_id
-    while node is not None:
-        path_ids.append(node)
-        node = visited[node]
-    path_ids.reverse()
-    
+    actors = actor_details(c, path_ids)
     path = []
     for i in range(len(path_ids) - 1):
         a1, a2 = path_ids[i], path_ids[i+1]
         key = (a1, a2) if a1 < a2 else (a2, a1)
         movie_id, movie_title = edge_movies.get(key, (None, "Unknown"))
-        c.execute('SELECT name, profile_path FROM actors WHERE id=?', (a1,))
-        actor = c.fetchone()
+        actor = actors.get(a1)
         path.append({"type": "actor", "id": a1, "name": actor[0] if actor else "Unknown", "profile_path": actor[1] if actor else None})
         path.append({"type": "movie", "id": movie_id, "title": movie_title})
-    c.execute('SELECT name, profile_path FROM actors WHERE id=?', (target_id,))
-    target = c.fetchone()
+    target = actors.get(target_id)
     path.append({"type": "actor", "id": target_id, "name": target[0] if target else "Unknown", "profile_path": target[1] if target else None})
     
     conn.close()
@@ -1177,56 +1222,27 @@ def find_optimal_path():
         
         # Build actor connections graph
         cursor.execute('''
-        SELECT m1.actor_id, m2.actor_id, m1.id, m1.title, m2.character
+        SELECT m1.actor_id, m2.actor_id, m1.id, m1.title
         FROM movie_credits m1
         JOIN movie_credits m2 ON m1.id = m2.id AND m1.actor_id < m2.actor_id
-        ORDER BY m1.actor_id
         ''')
         
-        graph = {}
-        edge_movies = {}
-        for a1, a2, movie_id, title, char in cursor.fetchall():
-            graph.setdefault(a1, []).append(a2)
-            graph.setdefault(a2, []).append(a1)
-            key = (a1, a2) if a1 < a2 else (a2, a1)
-            if key not in edge_movies:
-                edge_movies[key] = (movie_id, title)
-        
         # BFS to find shortest path
-        visited = {start_id: None}
-        q = deque([start_id])
-        found = False
-        while q and not found:
-            current = q.popleft()
-            for neighbor in graph.get(current, []):
-                if neighbor not in visited:
-                    visited[neighbor] = current
-                    if neighbor == target_id:
-                        found = True
-                        break
-                    q.append(neighbor)
-        
-        if not found:
+        path_ids, edge_movies = find_costar_path(cursor.fetchall(), start_id, target_id)
+        
+        if path_ids is None:
             conn.close()
             return jsonify({"error": "No path found between these actors"}), 404
         
-        # Reconstruct path: actor -> movie -> actor -> movie -> ... -> actor
-        path_ids = []
-        node = target_id
-        while node is not None:
-            path_ids.append(node)
-            node = visited[node]
-        path_ids.reverse()
-        
         # Build full path with movie details
+        actors = actor_details(cursor, path_ids)
         path = []
         for i in range(len(path_ids) - 1):
             a1, a2 = path_ids[i], path_ids[i+1]
             key = (a1, a2) if a1 < a2 else (a2, a1)
             movie_id, movie_title = edge_movies.get(key, (None, "Unknown"))
             
-            cursor.execute('SELECT name, profile_path FROM actors WHERE id=?', (a1,))
-            actor = cursor.fetchone()
+            actor = actors.get(a1)
             path.append({
                 "type": "actor", "id": a1,
                 "name": actor[0] if actor else "Unknown",
@@ -1237,8 +1253,7 @@ def find_optimal_path():
                 "title": movie_title
             })
         
-        cursor.execute('SELECT name, profile_path FROM actors WHERE id=?', (target_id,))
-        target = cursor.fetchone()
+        target = actors.get(target_id)
         path.append({
             "type": "actor", "id": target_id,
             "name": target[0] if target else "Unknown",
@@ -364,7 +364,8 @@ def compress_path(path):
             if item['poster_path']:
                 compressed['p'] = item['poster_path']
         minimal_path.append(compressed)
-    json_str = json.dumps(minimal_path)
+    # Compact separators: the payload is only ever machine-read
+    json_str = json.dumps(minimal_path, separators=(',', ':'))
     return gzip.compress(json_str.encode('utf-8'))
 
 def create_connection_database(paths_by_difficulty, region="GLOBAL", output_path=None):
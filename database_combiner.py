@@ -78,64 +78,79 @@ def combine_databases(output_db_path, search_dirs):
     if os.path.exists(output_db_path):
         os.remove(output_db_path)
     
-    # Create the output database
-    output_conn = sqlite3.connect(output_db_path)
+    # Create the output database. Transactions are managed explicitly since
+    # ATTACH/DETACH can't run inside the implicit ones sqlite3 opens.
+    output_conn = sqlite3.connect(output_db_path, isolation_level=None)
     
-    tables_created = set()
+    # The output is rebuilt from scratch on failure, so skip the journal fsyncs
+    output_conn.execute("PRAGMA synchronous=OFF")
+    output_conn.execute("PRAGMA journal_mode=MEMORY")
+    # Keep the merge's page cache, index sorts and reads in memory
+    output_conn.execute("PRAGMA cache_size=-262144")  # 256 MB
+    output_conn.execute("PRAGMA mmap_size=1073741824")  # 1 GB
+    output_conn.execute("PRAGMA temp_store=MEMORY")
     
-    for db_file in db_files:
+    # Seed the output with a page-level copy of the first database; this
+    # brings its schema and indexes along and skips row-by-row inserts
+    print(f"Processing: {os.path.basename(db_files[0])}")
+    source_conn = sqlite3.connect(db_files[0])
+    source_conn.backup(output_conn)
+    source_conn.close()
+    
+    # The copy also brings the first source's CREATE INDEX statements. The
+    # combined database only ever carried the tables and their own
+    # constraints, and a UNIQUE index here would make the INSERT OR IGNORE
+    # merges below drop rows the tables accept, so those indexes are dropped
+    for (index_name,) in output_conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND sql IS NOT NULL;"
+    ).fetchall():
+        output_conn.execute(f'DROP INDEX "{index_name}";')
+    
+    tables_created = {row[0] for row in output_conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';"
+    )}
+    print(f"  Copied {len(tables_created)} tables")
+    
+    for db_file in db_files[1:]:
         print(f"Processing: {os.path.basename(db_file)}")
         
-        # Connect to the source database
-        source_conn = sqlite3.connect(db_file)
-        cursor = source_conn.cursor()
+        # Attach the source database so rows are copied by SQLite itself
+        # instead of being fetched into Python and inserted back
+        output_conn.execute("ATTACH DATABASE ? AS src", (db_file,))
+        output_conn.execute("BEGIN")
         
-        # Get all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = [row[0] for row in cursor.fetchall() if not row[0].startswith('sqlite_')]
+        # Get all tables with their schema
+        tables = output_conn.execute(
+            "SELECT name, sql FROM src.sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';"
+        ).fetchall()
         
-        for table_name in tables:
-            # Get table schema
-            cursor.execute(f"SELECT sql FROM sqlite_master WHERE type='table' AND name='{table_name}';")
-            create_table_sql = cursor.fetchone()[0]
-            
+        for table_name, create_table_sql in tables:
             # Create the table in the output database if it doesn't exist
             if table_name not in tables_created:
                 try:
                     output_conn.execute(create_table_sql)
-                    output_conn.commit()
                     tables_created.add(table_name)
                 except sqlite3.OperationalError as e:
                     print(f"  Warning: Could not create table {table_name}: {e}")
                     continue
             
             # Get column names
-            cursor.execute(f"PRAGMA table_info({table_name});")
-            columns = [col[1] for col in cursor.fetchall()]
+            columns = [col[1] for col in output_conn.execute(f"PRAGMA src.table_info({table_name});")]
             
             if not columns:
                 continue
             
-            # Get data from source table
-            cursor.execute(f"SELECT * FROM {table_name};")
-            rows = cursor.fetchall()
-            
-            if rows:
-                # Create INSERT statement with column names
-                columns_str = ', '.join(columns)
-                placeholders = ', '.join(['?'] * len(columns))
-                insert_sql = f"INSERT OR IGNORE INTO {table_name} ({columns_str}) VALUES ({placeholders})"
-                
-                # Insert data in batches
-                batch_size = 1000
-                for i in range(0, len(rows), batch_size):
-                    batch = rows[i:i+batch_size]
-                    output_conn.executemany(insert_sql, batch)
-                
-                output_conn.commit()
-                print(f"  Added {len(rows)} records to table {table_name}")
+            # Copy the rows with column names, as column order may differ between sources
+            columns_str = ', '.join(columns)
+            cursor = output_conn.execute(
+                f"INSERT OR IGNORE INTO main.{table_name} ({columns_str}) "
+                f"SELECT {columns_str} FROM src.{table_name};"
+            )
+            if cursor.rowcount > 0:
+                print(f"  Added {cursor.rowcount} records to table {table_name}")
         
-        source_conn.close()
+        output_conn.execute("COMMIT")
+        output_conn.execute("DETACH DATABASE src")
     
     output_conn.close()
     print(f"Successfully combined databases into {output_db_path}")
@@ -160,48 +175,54 @@ def cleanup_old_databases(output_db_path):
     old_db_patterns = ["actors_*.db"]
     
     # Track statistics
-    removed_count = 0
     untracked_count = 0
     
-    # Find and remove old database files
+    # Collect the old database files first so git runs once for all of them
+    old_files = []
     for directory in search_dirs:
         if not os.path.exists(directory):
             continue
             
         for pattern in old_db_patterns:
-            old_files = glob.glob(os.path.join(directory, pattern))
-            
-            for file_path in old_files:
+            for file_path in glob.glob(os.path.join(directory, pattern)):
                 # Skip the output file
                 if os.path.abspath(file_path) == os.path.abspath(output_db_path):
                     continue
                 
                 print(f"Found old database: {file_path}")
-                
-                # Check if file is tracked by Git
-                result = subprocess.run(
-                    ['git', 'ls-files', '--error-unmatch', file_path], 
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    shell=True
-                )
-                
-                if result.returncode == 0:  # File is tracked
-                    print(f"  Removing from Git tracking: {os.path.basename(file_path)}")
-                    try:
-                        subprocess.run(['git', 'rm', file_path], check=True, shell=True)
-                        untracked_count += 1
-                    except subprocess.CalledProcessError:
-                        print(f"  Failed to remove from Git, deleting manually")
-                        os.remove(file_path)
-                else:  # File is not tracked
-                    print(f"  Deleting: {os.path.basename(file_path)}")
-                    os.remove(file_path)
-                
-                removed_count += 1
+                old_files.append(file_path)
+    
+    # Check which files are tracked by Git
+    tracked = []
+    if old_files:
+        try:
+            result = subprocess.run(
+                ['git', 'ls-files', '-z', '--'] + old_files,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            listed = {os.path.abspath(path) for path in result.stdout.split('\0') if path}
+            tracked = [path for path in old_files if os.path.abspath(path) in listed]
+        except OSError:
+            print("  Git is not available, deleting files manually")
+    untracked = [path for path in old_files if path not in tracked]
+    
+    if tracked:
+        for file_path in tracked:
+            print(f"  Removing from Git tracking: {os.path.basename(file_path)}")
+        try:
+            subprocess.run(['git', 'rm', '--'] + tracked, check=True)
+            untracked_count += len(tracked)
+        except subprocess.CalledProcessError:
+            print(f"  Failed to remove from Git, deleting manually")
+            untracked.extend(path for path in tracked if os.path.exists(path))
+    
+    for file_path in untracked:
+        print(f"  Deleting: {os.path.basename(file_path)}")
+        os.remove(file_path)
     
-    print(f"Cleanup complete: Removed {removed_count} files, untracked {untracked_count} from Git")
+    print(f"Cleanup complete: Removed {len(old_files)} files, untracked {untracked_count} from Git")
     
     # Update .gitignore to exclude actor_*.db files in the future
     gitignore_path = os.path.join(os.getcwd(), '.gitignore')
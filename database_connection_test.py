@@ -2,8 +2,56 @@
 # filepath: c:\Projects\ActorToActor\test_connection.py
 import sqlite3
 import os
+import sys
 import json
-import gzip
+import zlib
+from collections import defaultdict
+from database_diagnostic import configure_read_only
+
+def find_actor_id(cursor, name):
+    """Id of the most popular actor matching the first and last word of name.
+
+    Uses the actors_fts name index when database_gui has built one, instead
+    of scanning every actor with LIKE '%first%last%'. The test only reads
+    the database, so it doesn't build the index itself.
+    """
+    words = name.split()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='actors_fts'")
+    if cursor.fetchone():
+        fts_query = " ".join('"' + word.replace('"', '""') + '"*' for word in (words[0], words[-1]))
+        cursor.execute("""
+            SELECT a.id FROM actors_fts f
+            JOIN actors a ON a.id = f.rowid
+            WHERE actors_fts MATCH ?
+            ORDER BY a.popularity DESC
+            LIMIT 1
+        """, (fts_query,))
+    else:
+        cursor.execute("SELECT id FROM actors WHERE name LIKE ? ORDER BY popularity DESC LIMIT 1",
+                       (f"%{words[0]}%{words[-1]}%",))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+def get_precomputed_path(connection_db, actor1_id, actor2_id):
+    """(connection_length, difficulty, path items) stored for an actor pair, or None"""
+    conn = sqlite3.connect(connection_db)
+    configure_read_only(conn)
+    cursor = conn.cursor()
+    
+    # Check both directions
+    cursor.execute("""
+        SELECT connection_length, difficulty, optimal_path FROM actor_connections 
+        WHERE (start_id = ? AND target_id = ?) OR (start_id = ? AND target_id = ?)
+    """, (actor1_id, actor2_id, actor2_id, actor1_id))
+    connection = cursor.fetchone()
+    conn.close()
+    
+    if not connection:
+        return None
+    connection_length, difficulty, optimal_path = connection
+    # wbits=31 reads the gzip framing; json parses the UTF-8 bytes directly,
+    # so no intermediate str is built
+    return connection_length, difficulty, json.loads(zlib.decompress(optimal_path, wbits=31))
 
 def test_basquiat_connection():
     print("==== Testing 'Basquiat' Connection Issue ====")
@@ -28,10 +76,15 @@ def test_basquiat_connection():
         
     # Connect to the actors database
     conn = sqlite3.connect(actors_db)
-    conn.row_factory = sqlite3.Row  # This enables column name access
+    configure_read_only(conn)
     cursor = conn.cursor()
     
-    # Check movie credits
+    # Resolve both actors once so the credit joins below filter on actor_id
+    samuel_id = find_actor_id(cursor, "Samuel Jackson")
+    pedro_id = find_actor_id(cursor, "Pedro Pascal")
+    
+    # Check movie credits. Each shared title is one row: Samuel's credits
+    # drive the join and Pedro's credit on the same title is a primary key probe.
     print("\n=== Checking Movie Credits ===")
     movie_query = """
     SELECT mc1.actor_id, a1.name, mc1.character, 
@@ -41,19 +94,19 @@ def test_basquiat_connection():
     JOIN movie_credits mc2 ON mc1.id = mc2.id
     JOIN actors a1 ON mc1.actor_id = a1.id
     JOIN actors a2 ON mc2.actor_id = a2.id
-    WHERE (a1.name LIKE '%Samuel%Jackson%' AND a2.name LIKE '%Pedro%Pascal%')
-    OR (a1.name LIKE '%Pedro%Pascal%' AND a2.name LIKE '%Samuel%Jackson%');
+    WHERE mc1.actor_id = ? AND mc2.actor_id = ?;
     """
     
-    cursor.execute(movie_query)
+    cursor.execute(movie_query, (samuel_id, pedro_id))
     movie_results = cursor.fetchall()
     
     if movie_results:
-        print(f"Found {len(movie_results)} movie connections:")
-        for row in movie_results:
-            print(f"Movie: {row['title']} (ID: {row['id']})")
-            print(f"  {row['name']} as '{row['character']}'")
-            print(f"  {row['name']} as '{row['character']}'")
+        out = [f"Found {len(movie_results)} movie connections:"]
+        for _, name1, character1, _, name2, character2, title, movie_id in movie_results:
+            out.append(f"Movie: {title} (ID: {movie_id})")
+            out.append(f"  {name1} as '{character1}'")
+            out.append(f"  {name2} as '{character2}'")
+        sys.stdout.write("\n".join(out) + "\n")
     else:
         print("No movie connections found")
     
@@ -67,114 +120,112 @@ def test_basquiat_connection():
     JOIN tv_credits tc2 ON tc1.id = tc2.id
     JOIN actors a1 ON tc1.actor_id = a1.id
     JOIN actors a2 ON tc2.actor_id = a2.id
-    WHERE (a1.name LIKE '%Samuel%Jackson%' AND a2.name LIKE '%Pedro%Pascal%')
-    OR (a1.name LIKE '%Pedro%Pascal%' AND a2.name LIKE '%Samuel%Jackson%');
+    WHERE tc1.actor_id = ? AND tc2.actor_id = ?;
     """
     
-    cursor.execute(tv_query)
+    cursor.execute(tv_query, (samuel_id, pedro_id))
     tv_results = cursor.fetchall()
     
     if tv_results:
-        print(f"Found {len(tv_results)} TV connections:")
-        for row in tv_results:
-            print(f"Show: {row['show_name']} (ID: {row['id']})")
-            print(f"  {row['name']} as '{row['character']}'")
-            print(f"  {row['name']} as '{row['character']}'")
+        out = [f"Found {len(tv_results)} TV connections:"]
+        for _, name1, character1, _, name2, character2, show_name, show_id in tv_results:
+            out.append(f"Show: {show_name} (ID: {show_id})")
+            out.append(f"  {name1} as '{character1}'")
+            out.append(f"  {name2} as '{character2}'")
+        sys.stdout.write("\n".join(out) + "\n")
     else:
         print("No TV connections found")
     
     # Check for the precomputed path in the connections database
     print("\n=== Checking Precomputed Connections ===")
     connection_db = "actor-game/public/actor_connections.db"
+    connection = None
     
     if os.path.exists(connection_db):
-        conn2 = sqlite3.connect(connection_db)
-        conn2.row_factory = sqlite3.Row
-        cursor2 = conn2.cursor()
-        
-        # Get actor IDs
-        cursor.execute("SELECT id FROM actors WHERE name LIKE '%Samuel%Jackson%'")
-        samuel_id = cursor.fetchone()
-        cursor.execute("SELECT id FROM actors WHERE name LIKE '%Pedro%Pascal%'")
-        pedro_id = cursor.fetchone()
-        
         if samuel_id and pedro_id:
-            samuel_id = samuel_id['id']
-            pedro_id = pedro_id['id']
-            
-            # Check both directions
-            cursor2.execute("""
-                SELECT * FROM actor_connections 
-                WHERE (start_id = ? AND target_id = ?) OR (start_id = ? AND target_id = ?)
-            """, (samuel_id, pedro_id, pedro_id, samuel_id))
-            
-            connection = cursor2.fetchone()
+            connection = get_precomputed_path(connection_db, samuel_id, pedro_id)
             
             if connection:
-                print(f"Found precomputed connection with length {connection['connection_length']} and difficulty {connection['difficulty']}")
+                connection_length, difficulty, path_items = connection
+                print(f"Found precomputed connection with length {connection_length} and difficulty {difficulty}")
                 
-                # Decompress the path data
-                path_data = gzip.decompress(connection['optimal_path']).decode('utf-8')
-                path_items = json.loads(path_data)
-                
-                print("\nFull path:")
+                out = ["\nFull path:"]
                 for item in path_items:
                     if item.get('t') == 'a':  # Actor
-                        print(f"Actor: {item.get('n')} (ID: {item.get('i')})")
+                        out.append(f"Actor: {item.get('n')} (ID: {item.get('i')})")
                     elif item.get('t') == 'm':  # Movie or TV
-                        print(f"Media: {item.get('n')} (ID: {item.get('i')})")
+                        out.append(f"Media: {item.get('n')} (ID: {item.get('i')})")
+                sys.stdout.write("\n".join(out) + "\n")
             else:
                 print("No precomputed connection found")
         else:
             print("Could not find actor IDs")
-        
-        conn2.close()
     else:
         print(f"Connections database not found at {connection_db}")
     
-    # Check if there's any title with 'basquiat' in it
-    print("\n=== Searching for 'Basquiat' Titles ===")
-    cursor.execute("""
-    SELECT 'MOVIE' as type, id, title FROM movie_credits 
-    WHERE LOWER(title) LIKE '%basquiat%'
-    UNION
-    SELECT 'TV' as type, id, name as title FROM tv_credits
-    WHERE LOWER(name) LIKE '%basquiat%'
-    """)
+    path_media = [item for item in connection[2] if item.get('t') == 'm'] if connection else []
     
-    basquiat_results = cursor.fetchall()
+    if path_media:
+        # The precomputed path already names its titles, so look those up by
+        # id instead of scanning every title for 'Basquiat'
+        print("\n=== Checking Titles in the Precomputed Path ===")
+        placeholders = ','.join('?' * len(path_media))
+        cursor.execute(f"""
+        SELECT DISTINCT 'MOVIE' as type, id, title FROM movie_credits WHERE id IN ({placeholders})
+        UNION
+        SELECT DISTINCT 'TV' as type, id, name as title FROM tv_credits WHERE id IN ({placeholders})
+        """, [int(item.get('i')) for item in path_media] * 2)
+        
+        # Movie and TV ids overlap, so keep the rows whose title the path names
+        path_titles = {(int(item.get('i')), item.get('n')) for item in path_media}
+        basquiat_results = [row for row in cursor if (row[1], row[2]) in path_titles]
+        label = "titles in the precomputed path"
+    else:
+        # Check if there's any title with 'basquiat' in it. LIKE already
+        # ignores ASCII case, so the column isn't lowered row by row.
+        print("\n=== Searching for 'Basquiat' Titles ===")
+        cursor.execute("""
+        SELECT 'MOVIE' as type, id, title FROM movie_credits 
+        WHERE title LIKE '%basquiat%'
+        UNION
+        SELECT 'TV' as type, id, name as title FROM tv_credits
+        WHERE name LIKE '%basquiat%'
+        """)
+        
+        basquiat_results = cursor.fetchall()
+        label = "titles containing 'Basquiat'"
     
     if basquiat_results:
-        print(f"Found {len(basquiat_results)} titles containing 'Basquiat':")
-        for row in basquiat_results:
-            print(f"{row['type']}: {row['title']} (ID: {row['id']})")
+        # See if these two actors are in any of these titles, with one
+        # query per credits table for all titles at once
+        actors_by_title = defaultdict(list)
+        for media_type, table in (('MOVIE', 'movie_credits'), ('TV', 'tv_credits')):
+            title_ids = [title_id for row_type, title_id, _ in basquiat_results if row_type == media_type]
+            if not title_ids:
+                continue
+            cursor.execute(f"""
+                SELECT c.id, a.name, c.character
+                FROM {table} c
+                JOIN actors a ON c.actor_id = a.id
+                WHERE c.id IN ({','.join('?' * len(title_ids))}) AND c.actor_id IN (?, ?)
+            """, title_ids + [samuel_id, pedro_id])
+            for title_id, name, character in cursor:
+                actors_by_title[media_type, title_id].append((name, character))
+        
+        out = [f"Found {len(basquiat_results)} {label}:"]
+        for media_type, title_id, title in basquiat_results:
+            out.append(f"{media_type}: {title} (ID: {title_id})")
             
-            # See if these two actors are in this particular title
-            params = (row['id'],)
-            if row['type'] == 'MOVIE':
-                cursor.execute("""
-                    SELECT a.name, mc.character
-                    FROM movie_credits mc
-                    JOIN actors a ON mc.actor_id = a.id
-                    WHERE mc.id = ? AND (a.name LIKE '%Samuel%Jackson%' OR a.name LIKE '%Pedro%Pascal%')
-                """, params)
-            else:
-                cursor.execute("""
-                    SELECT a.name, tc.character
-                    FROM tv_credits tc
-                    JOIN actors a ON tc.actor_id = a.id
-                    WHERE tc.id = ? AND (a.name LIKE '%Samuel%Jackson%' OR a.name LIKE '%Pedro%Pascal%')
-                """, params)
-                
-            actors_in_title = cursor.fetchall()
+            actors_in_title = actors_by_title[media_type, title_id]
             if actors_in_title:
-                print("  Actors in this title:")
-                for actor in actors_in_title:
-                    print(f"    {actor['name']} as '{actor['character']}'")
+                out.append("  Actors in this title:")
+                for name, character in actors_in_title:
+                    out.append(f"    {name} as '{character}'")
             else:
-                print("  No matching actors in this title")
+                out.append("  No matching actors in this title")
+        sys.stdout.write("\n".join(out) + "\n")
     else:
-        print("No titles containing 'Basquiat' found")
+        print(f"No {label} found")
     
     conn.close()
     
@@ -203,21 +254,17 @@ def test_specific_actor_connection(actor1_name="Jackie Chan", actor2_name="Keanu
         
     # Connect to the actors database
     conn = sqlite3.connect(actors_db)
-    conn.row_factory = sqlite3.Row
+    configure_read_only(conn)
     cursor = conn.cursor()
     
     # Get actor IDs
-    cursor.execute(f"SELECT id FROM actors WHERE name LIKE '%{actor1_name.split()[0]}%{actor1_name.split()[-1]}%'")
-    actor1_id = cursor.fetchone()
-    cursor.execute(f"SELECT id FROM actors WHERE name LIKE '%{actor2_name.split()[0]}%{actor2_name.split()[-1]}%'")
-    actor2_id = cursor.fetchone()
+    actor1_id = find_actor_id(cursor, actor1_name)
+    actor2_id = find_actor_id(cursor, actor2_name)
     
     if not actor1_id or not actor2_id:
         print(f"Could not find IDs for {actor1_name} and/or {actor2_name}")
         return
         
-    actor1_id = actor1_id['id']
-    actor2_id = actor2_id['id']
     print(f"Actor IDs: {actor1_name}={actor1_id}, {actor2_name}={actor2_id}")
     
     # Check movie credits where both actors appear
@@ -232,11 +279,11 @@ def test_specific_actor_connection(actor1_name="Jackie Chan", actor2_name="Keanu
     
     if movie_results:
         print(f"\nFound {len(movie_results)} shared movies:")
-        for row in movie_results:
-            print(f"Movie: {row['title']} (ID: {row['id']}, Released: {row['release_date']})")
-            print(f"  {actor1_name} as '{row['char1']}'")
-            print(f"  {actor2_name} as '{row['char2']}'")
-            print(f"  Popularity: {row['popularity']}")
+        for movie_id, title, release_date, popularity, char1, char2 in movie_results:
+            print(f"Movie: {title} (ID: {movie_id}, Released: {release_date})")
+            print(f"  {actor1_name} as '{char1}'")
+            print(f"  {actor2_name} as '{char2}'")
+            print(f"  Popularity: {popularity}")
     else:
         print("\nNo shared movies found")
     
@@ -262,8 +309,8 @@ def test_specific_actor_connection(actor1_name="Jackie Chan", actor2_name="Keanu
     
     if problematic_results:
         print(f"Found {len(problematic_results)} potentially problematic movies:")
-        for row in problematic_results:
-            print(f"Movie: {row['title']} (ID: {row['id']})")
+        for movie_id, title, _ in problematic_results:
+            print(f"Movie: {title} (ID: {movie_id})")
             
             # Check if both actors are in this movie
             check_query = """
@@ -271,10 +318,10 @@ def test_specific_actor_connection(actor1_name="Jackie Chan", actor2_name="Keanu
             FROM movie_credits
             WHERE id = ? AND actor_id IN (?, ?)
             """
-            cursor.execute(check_query, (row['id'], actor1_id, actor2_id))
+            cursor.execute(check_query, (movie_id, actor1_id, actor2_id))
             count_result = cursor.fetchone()
             
-            if count_result and count_result['actor_count'] == 2:
+            if count_result and count_result[0] == 2:
                 print("  ⚠️ BOTH ACTORS APPEAR IN THIS FILM - FALSE CONNECTION DETECTED!")
             else:
                 print("  Only one actor appears in this film")
@@ -1,9 +1,56 @@
 import os
 import sqlite3
-import pandas as pd
+import sys
 
-def debug_database(db_path):
-    """Analyze a SQLite database and print detailed information"""
+# Indexes the diagnostic GROUP BY and credit lookups read, as (table, statement).
+# The (id, actor_id) and (actor_id, region) primary keys cover the rest.
+DIAGNOSTIC_INDEXES = [
+    ("movie_credits", "CREATE INDEX IF NOT EXISTS idx_movie_credits_actor ON movie_credits (actor_id)"),
+    ("tv_credits", "CREATE INDEX IF NOT EXISTS idx_tv_credits_actor ON tv_credits (actor_id)"),
+    ("actor_regions", "CREATE INDEX IF NOT EXISTS idx_actor_regions ON actor_regions (region)"),
+]
+
+def create_indexes(conn):
+    """Create the diagnostic indexes on whichever of their tables exist.
+
+    Only run when asked for with --create-indexes, since it changes the
+    schema being reported on. Best effort: a read-only database keeps its
+    existing query plans.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    tables = {row[0] for row in cursor.fetchall()}
+    try:
+        for table, statement in DIAGNOSTIC_INDEXES:
+            if table in tables:
+                cursor.execute(statement)
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not create indexes: {e}")
+
+# Applied once the indexes exist: the diagnostics only read, and scan most of
+# the file, so give them a large cache and memory-mapped pages
+READ_ONLY_PRAGMAS = [
+    "PRAGMA mmap_size=1073741824",  # 1 GB
+    "PRAGMA cache_size=-262144",  # 256 MB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA query_only=1",
+]
+
+def configure_read_only(conn):
+    """Switch a connection to read-only scanning; unsupported pragmas are skipped"""
+    for pragma in READ_ONLY_PRAGMAS:
+        try:
+            conn.execute(pragma)
+        except sqlite3.Error:
+            pass
+
+def debug_database(db_path, build_indexes=False):
+    """Analyze a SQLite database and print detailed information.
+
+    The database is only read unless build_indexes is set, in which case the
+    DIAGNOSTIC_INDEXES are created first.
+    """
     if not os.path.exists(db_path):
         print(f"❌ Database not found at {db_path}")
         return
@@ -13,19 +60,27 @@ def debug_database(db_path):
     
     try:
         conn = sqlite3.connect(db_path)
+        if build_indexes:
+            create_indexes(conn)
+        configure_read_only(conn)
         cursor = conn.cursor()
         
+        # Read every statement from one snapshot so the shared lock is taken
+        # once and the page cache isn't revalidated between queries
+        cursor.execute("BEGIN")
+        
         # Get tables
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
         tables = cursor.fetchall()
         print(f"📋 Tables found: {[t[0] for t in tables]}")
         
-        # Get row counts for each table
-        for table in tables:
-            table_name = table[0]
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            count = cursor.fetchone()[0]
-            print(f"  - {table_name}: {count} rows")
+        # Get row counts for every table in one statement
+        if tables:
+            cursor.execute(" UNION ALL ".join(
+                f"SELECT ?, COUNT(*) FROM \"{table[0]}\"" for table in tables
+            ), [table[0] for table in tables])
+            out = [f"  - {table_name}: {count} rows" for table_name, count in cursor]
+            sys.stdout.write("\n".join(out) + "\n")
         
         # For actors, get a sample
         if 'actors' in [t[0] for t in tables]:
@@ -33,9 +88,9 @@ def debug_database(db_path):
             columns = [description[0] for description in cursor.description]
             sample = cursor.fetchall()
             
-            print(f"\n📝 Sample actors columns: {columns}")
-            for row in sample:
-                print(f"  - {row}")
+            out = [f"\n📝 Sample actors columns: {columns}"]
+            out.extend(f"  - {row}" for row in sample)
+            sys.stdout.write("\n".join(out) + "\n")
             
             # Get actor popularity range
             cursor.execute("SELECT MIN(popularity), MAX(popularity), AVG(popularity) FROM actors")
@@ -45,83 +100,87 @@ def debug_database(db_path):
         # Check actor regions distribution
         if 'actor_regions' in [t[0] for t in tables]:
             cursor.execute("SELECT region, COUNT(*) as actor_count FROM actor_regions GROUP BY region ORDER BY actor_count DESC")
-            region_counts = cursor.fetchall()
-            print(f"\n🌎 Actor distribution by region:")
-            for region, count in region_counts:
-                print(f"  - {region}: {count} actors")
+            # The region list isn't capped, so format rows as they stream from the cursor
+            out = [f"\n🌎 Actor distribution by region:"]
+            out.extend(f"  - {region}: {count} actors" for region, count in cursor)
+            sys.stdout.write("\n".join(out) + "\n")
             
             # Check for actors in multiple regions
+            # Names and region lists come from the same query
             cursor.execute("""
-                SELECT actor_id, COUNT(*) as region_count 
-                FROM actor_regions 
-                GROUP BY actor_id 
+                SELECT ar.actor_id, COALESCE(a.name, 'Unknown'), COUNT(*) as region_count,
+                       GROUP_CONCAT(ar.region, ', ')
+                FROM actor_regions ar
+                LEFT JOIN actors a ON a.id = ar.actor_id
+                GROUP BY ar.actor_id 
                 HAVING region_count > 1
                 ORDER BY region_count DESC 
                 LIMIT 5
             """)
             multi_region_actors = cursor.fetchall()
-            print(f"\n🌐 Top actors in multiple regions:")
-            for actor_id, count in multi_region_actors:
-                cursor.execute(f"SELECT name FROM actors WHERE id = {actor_id}")
-                name_row = cursor.fetchone()
-                name = name_row[0] if name_row else "Unknown"
-                
-                # Get the specific regions
-                cursor.execute(f"SELECT region FROM actor_regions WHERE actor_id = {actor_id}")
-                regions = [r[0] for r in cursor.fetchall()]
-                
-                print(f"  - {name} (ID: {actor_id}): {count} regions ({', '.join(regions)})")
+            out = [f"\n🌐 Top actors in multiple regions:"]
+            out.extend(f"  - {name} (ID: {actor_id}): {count} regions ({regions})"
+                       for actor_id, name, count, regions in multi_region_actors)
+            sys.stdout.write("\n".join(out) + "\n")
         
         # Check for movie credits
         if 'movie_credits' in [t[0] for t in tables]:
-            cursor.execute("SELECT COUNT(DISTINCT actor_id) FROM movie_credits")
-            actor_count = cursor.fetchone()[0]
-            print(f"\n🎬 Actors with movie credits: {actor_count}")
-            
-            # Get credits per actor
+            # Count the credited actors and rank them in one pass over the
+            # table; the window count sees every group before the LIMIT
             cursor.execute("""
-                SELECT actor_id, COUNT(*) as credit_count 
-                FROM movie_credits 
-                GROUP BY actor_id 
-                ORDER BY credit_count DESC 
-                LIMIT 5
+                SELECT p.actor_count, p.actor_id, COALESCE(a.name, 'Unknown'), p.credit_count
+                FROM (
+                    SELECT actor_id, COUNT(*) as credit_count, COUNT(*) OVER () as actor_count
+                    FROM movie_credits
+                    GROUP BY actor_id 
+                    ORDER BY credit_count DESC 
+                    LIMIT 5
+                ) p
+                LEFT JOIN actors a ON a.id = p.actor_id
+                ORDER BY p.credit_count DESC
             """)
-            top_actors = cursor.fetchall()
-            print(f"📊 Top actors by movie credit count:")
-            for actor_id, count in top_actors:
-                cursor.execute(f"SELECT name FROM actors WHERE id = {actor_id}")
-                name_row = cursor.fetchone()
-                name = name_row[0] if name_row else "Unknown"
-                print(f"  - {name} (ID: {actor_id}): {count} movies")
+            rows = cursor.fetchall()
+            actor_count = rows[0][0] if rows else 0
+            top_actors = [row[1:] for row in rows]
+            print(f"\n🎬 Actors with movie credits: {actor_count}")
+            
+            out = [f"📊 Top actors by movie credit count:"]
+            out.extend(f"  - {name} (ID: {actor_id}): {count} movies" for actor_id, name, count in top_actors)
+            sys.stdout.write("\n".join(out) + "\n")
         
         # Check for TV credits
         if 'tv_credits' in [t[0] for t in tables]:
-            cursor.execute("SELECT COUNT(DISTINCT actor_id) FROM tv_credits")
-            actor_count = cursor.fetchone()[0]
-            print(f"\n📺 Actors with TV credits: {actor_count}")
-            
-            # Get TV credits per actor
+            # Count and rank TV actors the same way
             cursor.execute("""
-                SELECT actor_id, COUNT(*) as credit_count 
-                FROM tv_credits 
-                GROUP BY actor_id 
-                ORDER BY credit_count DESC 
-                LIMIT 5
+                SELECT p.actor_count, p.actor_id, COALESCE(a.name, 'Unknown'), p.credit_count
+                FROM (
+                    SELECT actor_id, COUNT(*) as credit_count, COUNT(*) OVER () as actor_count
+                    FROM tv_credits
+                    GROUP BY actor_id 
+                    ORDER BY credit_count DESC 
+                    LIMIT 5
+                ) p
+                LEFT JOIN actors a ON a.id = p.actor_id
+                ORDER BY p.credit_count DESC
             """)
-            top_actors = cursor.fetchall()
-            print(f"📊 Top actors by TV credit count:")
-            for actor_id, count in top_actors:
-                cursor.execute(f"SELECT name FROM actors WHERE id = {actor_id}")
-                name_row = cursor.fetchone()
-                name = name_row[0] if name_row else "Unknown"
-                print(f"  - {name} (ID: {actor_id}): {count} TV shows")
+            rows = cursor.fetchall()
+            actor_count = rows[0][0] if rows else 0
+            top_actors = [row[1:] for row in rows]
+            print(f"\n📺 Actors with TV credits: {actor_count}")
+            
+            out = [f"📊 Top actors by TV credit count:"]
+            out.extend(f"  - {name} (ID: {actor_id}): {count} TV shows" for actor_id, name, count in top_actors)
+            sys.stdout.write("\n".join(out) + "\n")
         
+        conn.rollback()
         conn.close()
         
     except Exception as e:
         print(f"❌ Error analyzing database: {e}")
 
 if __name__ == "__main__":
+    build_indexes = "--create-indexes" in sys.argv[1:]
+    
     # Check for the consolidated database in various locations
     possible_paths = [
         "actor-game/public/actors.db",
@@ -133,7 +192,7 @@ if __name__ == "__main__":
     for path in possible_paths:
         if os.path.exists(path):
             print(f"🔍 Found database at {path}\n")
-            debug_database(path)
+            debug_database(path, build_indexes)
             found = True
             break
     
@@ -1,34 +1,547 @@
 #!/usr/bin/env python
 import os
 import sqlite3
-import networkx as nx
+import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
-from collections import deque
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from itertools import chain
 from PIL import Image, ImageTk
 import io
+import hashlib
+import re
 import requests
+from requests.adapters import HTTPAdapter
 import webbrowser
 import traceback
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# Number of decoded profile images kept alive for reuse across views
+IMAGE_CACHE_SIZE = 256
+
+# Downloaded profile images kept on disk across runs, least recently used
+# removed first once the directory grows past the cap
+IMAGE_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "actortoactor", "images")
+IMAGE_DISK_CACHE_BYTES = 200 * 1024 * 1024
+
+# Threads running database work (loading, searches, credits, path finding)
+# off the Tk thread; SQLite reads gain little from more
+DB_WORKERS = 4
+
+# Threads fetching profile images, and the TMDB connections kept open for them
+IMAGE_WORKERS = 4
+
+# Profile images of the top search results fetched ahead of a click
+PREFETCH_IMAGE_COUNT = 20
+
+# Shortest paths remembered per graph build, most recently used kept
+PATH_CACHE_SIZE = 1024
+
+# Typed actor names resolved to ids, most recently used kept
+ACTOR_ID_CACHE_SIZE = 1024
+
+# Credit and co-star rows read per fetch and posted to the Tk thread together
+CREDIT_FETCH_SIZE = 100
+
+# Character-name fragments that hide a credit from the actor's credit lists
+# ("self" also covers "himself"/"herself")
+EXCLUDED_CHARACTER_TERMS = ("self", "archive", "archival", "stock footage", "final cut")
+
+# All the terms as one case-insensitive pattern, so a character name is
+# scanned once without building a lowercased copy
+_EXCLUDED_CHARACTER_RE = re.compile("|".join(map(re.escape, EXCLUDED_CHARACTER_TERMS)), re.IGNORECASE)
+
+# Indexes created on the actors database at load time, as (table, statement)
+ACTOR_DB_INDEXES = [
+    # Co-star and credit lookups start from one actor's credits
+    ("movie_credits", "CREATE INDEX IF NOT EXISTS idx_movie_credits_actor ON movie_credits (actor_id)"),
+    ("tv_credits", "CREATE INDEX IF NOT EXISTS idx_tv_credits_actor ON tv_credits (actor_id)"),
+    # Stats tab top-100 list reads the index in order instead of sorting every actor
+    ("actors", "CREATE INDEX IF NOT EXISTS idx_actors_popularity ON actors (popularity DESC)"),
+    # Exact name lookups when finding a path probe this instead of scanning actors
+    ("actors", "CREATE INDEX IF NOT EXISTS idx_actors_name_nocase ON actors (name COLLATE NOCASE)"),
+]
+
+# Statements issued on every search/click. Keeping them as constants (and
+# opening connections with a larger statement cache) lets sqlite3 reuse the
+# compiled statement instead of re-preparing it.
+SQLITE_CACHED_STATEMENTS = 256
+
+# Applied to every connection: the app mostly reads, and graph loading scans
+# whole credit tables, so serve pages from a memory map and a larger cache.
+# The journal mode is left alone so opening a database never rewrites it.
+SQLITE_CONNECTION_PRAGMAS = [
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB
+    "PRAGMA temp_store=MEMORY",
+]
+
+SQL_SEARCH_ACTORS_FTS = """
+    SELECT a.id, a.name, a.popularity
+    FROM actors_fts f
+    JOIN actors a ON a.id = f.rowid
+    WHERE actors_fts MATCH ?
+    ORDER BY a.popularity DESC
+    LIMIT ?
+"""
+
+SQL_SEARCH_ACTORS_LIKE = """
+    SELECT id, name, popularity
+    FROM actors
+    WHERE name LIKE ?
+    ORDER BY popularity DESC
+    LIMIT ?
+"""
+
+# The explicit collation matches idx_actors_name_nocase, so typed names
+# don't need the exact capitalisation to resolve without a partial search.
+# Actors can share a name, so the most popular one is taken.
+SQL_ACTOR_BY_EXACT_NAME = """
+    SELECT id FROM actors
+    WHERE name = ? COLLATE NOCASE
+    ORDER BY popularity DESC
+    LIMIT 1
+"""
+
+SQL_ACTOR_BY_ID = "SELECT name, profile_path, popularity, place_of_birth FROM actors WHERE id = ?"
+
+SQL_ACTOR_COUNT = "SELECT COUNT(*) FROM actors"
+
+# Fixed arity so every search reuses one cached statement; unused slots are
+# bound to NULL, which matches no id
+SQL_PREFETCH_PROFILE_PATHS = (
+    f"SELECT profile_path FROM actors WHERE id IN ({','.join('?' * PREFETCH_IMAGE_COUNT)})"
+)
+
+SQL_TOP_ACTORS = """
+    SELECT id, name, popularity
+    FROM actors
+    WHERE popularity > 0
+    ORDER BY popularity DESC
+    LIMIT 100
+"""
+
+SQL_MOVIE_CREDITS = """
+    SELECT id, title, character, release_date
+    FROM movie_credits
+    WHERE actor_id = ?
+    ORDER BY release_date DESC
+"""
+
+SQL_TV_CREDITS = """
+    SELECT id, name, character, first_air_date
+    FROM tv_credits
+    WHERE actor_id = ?
+    ORDER BY first_air_date DESC
+"""
+
+# Precomputed pairs whose actors are both in the attached actors database.
+# actor_connections ids are stored as text, so SQLite casts them while reading.
+SQL_PRECOMPUTED_PAIRS = """
+    SELECT c.start_id, c.target_id
+    FROM (
+        SELECT CAST(start_id AS INTEGER) AS start_id, CAST(target_id AS INTEGER) AS target_id
+        FROM actor_connections
+    ) c
+    WHERE c.start_id IN (SELECT id FROM actors_db.actors)
+    AND c.target_id IN (SELECT id FROM actors_db.actors)
+"""
+
+# actor_connections ids are stored as text; the lookup is a primary key prefix
+SQL_PRECOMPUTED_PATH = """
+    SELECT optimal_path
+    FROM actor_connections
+    WHERE start_id = ? AND target_id = ?
+    LIMIT 1
+"""
+
+# Condition on a credit row {c} (its actor's row is {a}) for the credits that
+# link co-stars. Self-appearances are dropped, including characters named
+# after the actor, so rows need no Python filtering.
+SQL_ROLE_CREDIT = """
+    LOWER({c}.character) NOT IN ('self', 'himself', 'herself')
+    AND {c}.character NOT LIKE 'self%'
+    AND {c}.character IS NOT NULL
+    AND {c}.character != ''
+    AND {c}.character IS NOT {a}.name
+"""
+
+# Counts the same credits as the path-finding graph, so the co-star list is
+# the same whether it comes from here or from CoStarGraph.costars
+SQL_COSTARS = f"""
+    SELECT a.id, a.name, COUNT(*) AS movie_count, a.popularity
+    FROM movie_credits m1
+    LEFT JOIN actors a1 ON a1.id = m1.actor_id
+    JOIN movie_credits m2 ON m2.id = m1.id
+    JOIN actors a ON a.id = m2.actor_id
+    WHERE m1.actor_id = ? AND m2.actor_id != ?
+    AND {SQL_ROLE_CREDIT.format(c='m1', a='a1')}
+    AND {SQL_ROLE_CREDIT.format(c='m2', a='a')}
+    GROUP BY a.id
+    ORDER BY movie_count DESC, a.popularity DESC
+    LIMIT 100
+"""
+
+# Credits that link co-stars in the path-finding graph, one SELECT per
+# credits table joined with UNION ALL
+SQL_GRAPH_CREDITS = f"""
+    SELECT c.actor_id, c.id, {{is_tv}}, c.is_mcu IS 1
+    FROM {{table}} c
+    LEFT JOIN actors a ON a.id = c.actor_id
+    WHERE {SQL_ROLE_CREDIT.format(c='c', a='a')}
+"""
+
+def _connect(db_path):
+    """Open a database with the shared statement cache and connection pragmas.
+
+    Pooled connections are handed between worker threads (one thread at a
+    time), so sqlite3's same-thread check is turned off.
+    """
+    conn = sqlite3.connect(db_path, cached_statements=SQLITE_CACHED_STATEMENTS, check_same_thread=False)
+    for pragma in SQLITE_CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def _fts_prefix_query(term):
+    """Turn free text into an FTS5 prefix query, e.g. 'sam jack' -> '"sam"* "jack"*'"""
+    return " ".join('"' + token.replace('"', '""') + '"*' for token in term.split())
+
+def _is_excluded_character(character):
+    """True for self-appearances, archive footage and similar non-roles"""
+    return _EXCLUDED_CHARACTER_RE.search(character) is not None
+
+def _credit_rows(credits):
+    """Treeview rows for (id, title, character, date) credits, minus non-roles;
+    dates are ISO so the year is a slice"""
+    return [
+        (credit_id, title, character, date[:4] if date else "N/A")
+        for credit_id, title, character, date in credits
+        if character and not _is_excluded_character(character)
+    ]
+
+def _costar_rows(costars):
+    """Treeview rows for (id, name, movie count, popularity) co-stars"""
+    return [(costar_id, name, movie_count, f"{popularity:.1f}")
+            for costar_id, name, movie_count, popularity in costars]
+
+def _bulk_insert(tree, rows):
+    """Append rows to a Treeview through the raw Tcl insert command, skipping
+    the option parsing ttk.Treeview.insert does on every call"""
+    call, widget = tree.tk.call, tree._w
+    for row in rows:
+        call(widget, "insert", "", "end", "-values", row)
+
+def _csr(rows, cols, n_rows):
+    """(indptr, indices) arrays for the (row, col) pairs, columns sorted per row"""
+    order = np.lexsort((cols, rows))
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=n_rows))])
+    return indptr, cols[order].astype(np.int32)
+
+def _csr_slots(indptr, rows):
+    """Slot numbers of every entry in the given CSR rows, and the row each came from"""
+    begins = indptr[rows]
+    counts = indptr[rows + 1] - begins
+    offsets = np.cumsum(counts) - counts
+    return np.arange(counts.sum()) - np.repeat(offsets - begins, counts), np.repeat(rows, counts)
+
+class CoStarGraph:
+    """Actor <-> title credit graph stored as CSR arrays rather than NetworkX dicts.
+
+    Actors and titles are remapped to contiguous rows: ids[i] is the TMDB id
+    of actor row i, title_ids[j] / title_is_tv[j] identify title row j.
+    actor_adj and movie_adj are (indptr, indices) pairs listing the titles of
+    each actor and the cast of each title; two actors are co-stars when they
+    share a title.
+    """
+
+    def __init__(self):
+        self._cache_lock = threading.Lock()  # guards path_cache, shared by searches on different workers
+        self.clear()
+
+    def clear(self):
+        self.nodes = {}  # actor id -> attributes (name, profile_path, popularity)
+        self.precomputed = set()  # (start_id, target_id) pairs with an actor_connections row
+        self.path_cache = OrderedDict()  # (start_id, target_id, include_tv, exclude_mcu) -> shortest_path result
+        self.title_masks = {}  # (include_tv, exclude_mcu) -> allowed titles, see _allowed_titles
+        self.title_labels = {}  # (title_id, is_tv) -> path display label, filled as paths are shown
+        self.ids = np.empty(0, dtype=np.int64)
+        self.title_keys = np.empty(0, dtype=np.int64)
+        self.title_ids = np.empty(0, dtype=np.int64)
+        self.title_is_tv = np.empty(0, dtype=bool)
+        self.title_is_mcu = np.empty(0, dtype=bool)
+        self.actor_adj = (np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int32))
+        self.movie_adj = (np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int32))
+
+    def __contains__(self, actor_id):
+        return actor_id in self.nodes
+
+    def has_node(self, actor_id):
+        return actor_id in self.nodes
+
+    def add_node(self, actor_id, **attrs):
+        self.nodes[actor_id] = attrs
+
+    def add_nodes_from(self, nodes):
+        """Add (actor_id, attributes) pairs in one dict update"""
+        self.nodes.update(nodes)
+
+    def number_of_credits(self):
+        return len(self.actor_adj[1])
+
+    def set_credits(self, credit_rows):
+        """Build the adjacency from (actor_id, title_id, is_tv, is_mcu) credit rows"""
+        credits = np.asarray(credit_rows, dtype=np.int64).reshape(-1, 4)
+        self.ids = np.unique(np.concatenate([np.fromiter(self.nodes, dtype=np.int64, count=len(self.nodes)),
+                                             credits[:, 0]]))
+
+        # Movie and TV ids overlap, so titles are keyed on (id, is_tv)
+        self.title_keys, title_rows = np.unique(credits[:, 1] * 2 + credits[:, 2], return_inverse=True)
+        actor_rows = np.searchsorted(self.ids, credits[:, 0])
+        self.title_ids = self.title_keys // 2
+        self.title_is_tv = (self.title_keys % 2).astype(bool)
+        self.title_is_mcu = np.bincount(title_rows, weights=credits[:, 3], minlength=len(self.title_keys)) > 0
+        self.title_masks = {}
+
+        self.actor_adj = _csr(actor_rows, title_rows, len(self.ids))
+        self.movie_adj = _csr(title_rows, actor_rows, len(self.title_keys))
+
+    def _row(self, actor_id):
+        """Actor row of an actor id, or None if the actor is not in the graph"""
+        i = int(np.searchsorted(self.ids, actor_id))
+        if i < len(self.ids) and self.ids[i] == actor_id:
+            return i
+        return None
+
+    def _titles(self, row):
+        indptr, indices = self.actor_adj
+        return indices[indptr[row]:indptr[row + 1]]
+
+    def _title(self, title_row):
+        return int(self.title_ids[title_row]), bool(self.title_is_tv[title_row])
+
+    def shared_title(self, actor1, actor2):
+        """(title_id, is_tv) of a title both actors appear in (a movie if any), or None"""
+        u, v = self._row(actor1), self._row(actor2)
+        if u is None or v is None:
+            return None
+        shared = np.intersect1d(self._titles(u), self._titles(v), assume_unique=True)
+        if not len(shared):
+            return None
+        return self._title(shared[np.argmin(self.title_is_tv[shared])])
+
+    def costars(self, actor_id, limit=100):
+        """(co-star id, shared movie count) pairs for an actor, most shared
+        movies first and then most popular; TV credits aren't counted.
+
+        Like SQL_COSTARS, only co-stars with an actors row are listed.
+        """
+        u = self._row(actor_id)
+        if u is None:
+            return []
+        titles = self._titles(u)
+        titles = titles[~self.title_is_tv[titles]]
+        slots, _ = _csr_slots(self.movie_adj[0], titles)
+        rows, counts = np.unique(self.movie_adj[1][slots], return_counts=True)
+        costar_ids = self.ids[rows]
+        keep = (rows != u) & np.fromiter((int(i) in self.nodes for i in costar_ids), dtype=bool,
+                                         count=len(costar_ids))
+        costar_ids, counts = costar_ids[keep], counts[keep]
+        popularity = np.array([self.nodes.get(int(i), {}).get('popularity') or 0.0 for i in costar_ids])
+        top = np.lexsort((-popularity, -counts))[:limit]
+        return [(int(costar_ids[i]), int(counts[i])) for i in top]
+
+    def shares_title(self, actor1, actor2, title_id, is_tv=False):
+        """True if both actors have a credit for the given title"""
+        key = title_id * 2 + is_tv
+        title = int(np.searchsorted(self.title_keys, key))
+        if title == len(self.title_keys) or self.title_keys[title] != key:
+            return False
+        title_indptr, title_actors = self.movie_adj
+        cast = title_actors[title_indptr[title]:title_indptr[title + 1]]
+        for actor_id in (actor1, actor2):
+            row = self._row(actor_id)
+            if row is None:
+                return False
+            slot = int(np.searchsorted(cast, row))
+            if slot == len(cast) or cast[slot] != row:
+                return False
+        return True
+
+    def shortest_path(self, start_id, target_id, include_tv=True, exclude_mcu=False):
+        """(actor_ids, titles) along a shortest path, or None if there is none.
+
+        titles[i] is the (title_id, is_tv) linking actor_ids[i] and
+        actor_ids[i + 1], as found by the search (so it respects the filters).
+        Results are cached until the graph is rebuilt; a cached search the
+        other way round is reused reversed.
+        """
+        key = (start_id, target_id, include_tv, exclude_mcu)
+        reverse_key = (target_id, start_id, include_tv, exclude_mcu)
+        with self._cache_lock:
+            if key in self.path_cache:
+                self.path_cache.move_to_end(key)
+                return self.path_cache[key]
+            cached_reverse = reverse_key in self.path_cache
+            if cached_reverse:
+                result = self.path_cache[reverse_key]
+        if not cached_reverse:
+            result = self._search(start_id, target_id, include_tv, exclude_mcu)
+        elif result is not None:
+            result = result[0][::-1], result[1][::-1]
+
+        with self._cache_lock:
+            self.path_cache[key] = result
+            while len(self.path_cache) > PATH_CACHE_SIZE:
+                self.path_cache.popitem(last=False)
+        return result
+
+    def _search(self, start_id, target_id, include_tv, exclude_mcu):
+        """Run the search behind shortest_path.
+
+        Bidirectional BFS: layers are grown alternately from both ends,
+        always on the side with fewer credits to scan, until the two visited
+        sets meet. This touches roughly 2*b^(d/2) edges instead of b^d.
+        """
+        start, target = self._row(start_id), self._row(target_id)
+        if start is None or target is None:
+            return None
+        if start == target:
+            return [start_id], []
+
+        allowed = self._allowed_titles(include_tv, exclude_mcu)
+        actor_indptr = self.actor_adj[0]
+        parents = [np.full(len(self.ids), -1, dtype=np.int32) for _ in range(2)]
+        vias = [np.full(len(self.ids), -1, dtype=np.int32) for _ in range(2)]
+        depths = [np.full(len(self.ids), -1, dtype=np.int32) for _ in range(2)]
+        titles_seen = [np.zeros(len(self.title_ids), dtype=bool) for _ in range(2)]
+        frontiers = [np.array([start], dtype=np.int32), np.array([target], dtype=np.int32)]
+        for side, row in enumerate((start, target)):
+            parents[side][row] = row
+            depths[side][row] = 0
+
+        while len(frontiers[0]) and len(frontiers[1]):
+            work = [(actor_indptr[f + 1] - actor_indptr[f]).sum() for f in frontiers]
+            side = 0 if work[0] <= work[1] else 1
+            other = 1 - side
+
+            frontiers[side] = self._expand(frontiers[side], parents[side], vias[side], depths[side],
+                                           titles_seen[side], allowed)
+
+            # Earlier layers didn't meet, so the shortest path goes through
+            # a newly reached actor; take the one closest to the other end
+            meet = frontiers[side][depths[other][frontiers[side]] >= 0]
+            if len(meet):
+                middle = int(meet[np.argmin(depths[other][meet])])
+                head, head_titles = self._walk_back(parents[0], vias[0], middle)
+                tail, tail_titles = self._walk_back(parents[1], vias[1], middle)
+                path = head[::-1] + tail[1:]
+                titles = head_titles[::-1] + tail_titles
+                return [int(self.ids[i]) for i in path], [self._title(t) for t in titles]
+
+        return None
+
+    def _allowed_titles(self, include_tv, exclude_mcu):
+        """Boolean mask of the titles a search with these filters may use, or
+        None if all are allowed. Filtered titles are masked instead of copying
+        the graph, and each mask is built once per filter combination."""
+        key = (include_tv, exclude_mcu)
+        if key not in self.title_masks:
+            allowed = None
+            if not include_tv:
+                allowed = ~self.title_is_tv
+            if exclude_mcu:
+                allowed = ~self.title_is_mcu if allowed is None else allowed & ~self.title_is_mcu
+            self.title_masks[key] = allowed
+        return self.title_masks[key]
+
+    def _expand(self, frontier, parent, via, depth, titles_seen, allowed):
+        """Advance one BFS side by an actor -> title -> actor layer and
+        return the newly reached actor rows.
+
+        Each hop gathers every CSR slot of the layer into one array and
+        filters it with numpy. A title already expanded from this side can't
+        lead anywhere new, so each title's cast is scanned at most once.
+        """
+        actor_indptr, actor_titles = self.actor_adj
+        title_indptr, title_actors = self.movie_adj
+
+        slots, sources = _csr_slots(actor_indptr, frontier)
+        titles = actor_titles[slots]
+        keep = ~titles_seen[titles]
+        if allowed is not None:
+            keep &= allowed[titles]
+        titles, sources = titles[keep], sources[keep]
+        titles_seen[titles] = True
+        title_source = np.empty(len(titles_seen), dtype=np.int32)
+        title_source[titles] = sources
+
+        slots, titles = _csr_slots(title_indptr, np.unique(titles))
+        neighbours = title_actors[slots]
+        unseen = depth[neighbours] < 0
+        neighbours = neighbours[unseen]
+
+        # An actor reached from several frontier actors keeps the first
+        # (actor, title) link; any of them lies on a shortest path
+        neighbours, first = np.unique(neighbours, return_index=True)
+        titles = titles[unseen][first]
+        parent[neighbours] = title_source[titles]
+        via[neighbours] = titles
+        depth[neighbours] = depth[frontier[0]] + 1
+        return neighbours
+
+    def _walk_back(self, parent, via, row):
+        """Rows from row back to the root of its BFS side, and the title
+        rows linking each consecutive pair"""
+        path, titles = [row], []
+        while parent[path[-1]] != path[-1]:
+            titles.append(int(via[path[-1]]))
+            path.append(int(parent[path[-1]]))
+        return path, titles
 
 class ActorToActorApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Actor Connections Database Analyzer")
         self.root.geometry("1000x700")
-        self.image_cache = {}
+        self.image_cache = OrderedDict()  # (profile_path, size) -> PhotoImage
+        self.image_executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS)
+        self.db_executor = ThreadPoolExecutor(max_workers=DB_WORKERS, thread_name_prefix='db')
+        self._disk_cache_lock = threading.Lock()
+        self._disk_cache_bytes = None  # size of IMAGE_DISK_CACHE_DIR, counted on first write
+        self.http = requests.Session()  # keep-alive connection reuse for TMDB images
+        # One pooled connection per image worker; a kept-alive connection the
+        # server has since closed is retried once instead of failing the image
+        self.http.mount('https://', HTTPAdapter(pool_maxsize=IMAGE_WORKERS, max_retries=1))
         self.current_actor_id = None
         self.db_connections = {}
+        self.db_pool = {}  # database path -> idle connections, see _acquire_db
         self.table_schemas = {}
-        self.graph = nx.Graph()
+        self.fts_ready = {}  # database path -> file mtime its actors_fts index was last checked at
+        # Held while _prepare_actors_db writes indexes, so a load and a stale
+        # index rebuild from a search don't write to the same file at once
+        self._prepare_lock = threading.Lock()
+        self.graph = CoStarGraph()
+        self._graph_loaded = False  # built on first path search, see _ensure_graph
+        # Held by the workers that clear, rebuild or read the graph, so none
+        # of them sees a half-built graph
+        self._graph_lock = threading.Lock()
+        self._graph_mtimes = {}  # database key -> mtime of the file the graph was built from
+        self._stats_cache = None  # ((actors db path, mtime), _query_stats result)
+        self.actor_id_cache = OrderedDict()  # (database path, casefolded name) -> actor id
+        self._search_future = None  # latest search submitted to db_executor
+        self._credits_future = None  # latest actor credit load submitted to db_executor
+        self._credits_generation = 0  # latest actor credit load started; older loads' rows are dropped
+        self._search_generation = 0  # latest search started; older results are dropped
+        self._path_widget_pool = []  # reusable widgets per visual path step, see _path_step_widgets
+        self._closing = False  # set by close_app; workers still running stop posting to the window
         
         # Setup UI components
         self._create_menu()
         self._create_notebook()
         self._create_status_bar()
+        self.root.protocol("WM_DELETE_WINDOW", self.close_app)
         
         # Load database
         self.load_database()
@@ -41,7 +554,7 @@ class ActorToActorApp:
         file_menu.add_command(label="Open Database...", command=self.open_database)
         file_menu.add_command(label="Refresh Database", command=self.refresh_database)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.close_app)
         menubar.add_cascade(label="File", menu=file_menu)
         
         # Tools menu
@@ -426,7 +939,9 @@ class ActorToActorApp:
             'actor-game/public/actors.db'
         ]
         
-        # Store connections to both databases
+        # Store connections to both databases; pooled connections may point
+        # at files that have since moved or been replaced
+        self._close_db_pool()
         self.db_connections = {}
         self.table_schemas = {}
         
@@ -439,7 +954,7 @@ class ActorToActorApp:
             
             if os.path.exists(abs_path):
                 try:
-                    conn = sqlite3.connect(abs_path)
+                    conn = _connect(abs_path)
                     cursor = conn.cursor()
                     
                     # Get all tables
@@ -457,13 +972,18 @@ class ActorToActorApp:
                         'size': size_display,
                         'tables': tables
                     }
-                    self.table_schemas[db_key] = {}
+                    self.table_schemas[db_key] = {table: [] for table in tables}
                     
-                    # Get schema for each table
-                    for table in tables:
-                        cursor.execute(f"PRAGMA table_info({table})")
-                        columns = [col[1] for col in cursor.fetchall()]
-                        self.table_schemas[db_key][table] = columns
+                    # Get the columns of every table in one query
+                    cursor.execute("""
+                        SELECT m.name, p.name
+                        FROM sqlite_master m
+                        JOIN pragma_table_info(m.name) p
+                        WHERE m.type='table'
+                        ORDER BY m.name, p.cid
+                    """)
+                    for table, column in cursor:
+                        self.table_schemas[db_key][table].append(column)
                     
                     conn.close()
                     self.status_var.set(f"Found database: {abs_path} with {len(tables)} tables")
@@ -472,224 +992,350 @@ class ActorToActorApp:
         
         if not self.db_connections:
             # If no databases found, show detailed diagnostic error
-            error_msg = f"No usable databases found. Checked paths:\n\n"
+            lines = ["No usable databases found. Checked paths:", ""]
             for path in all_paths_checked:
                 abs_path = os.path.abspath(path)
                 exists = "✓" if os.path.exists(abs_path) else "✗"
-                error_msg += f"{exists} {abs_path}\n"
+                lines.append(f"{exists} {abs_path}")
             
-            messagebox.showerror("Database Error", error_msg)
+            messagebox.showerror("Database Error", "\n".join(lines) + "\n")
             return False
         
         # Show summary of found databases
-        db_summary = "Found databases:\n"
+        lines = ["Found databases:"]
         for db_name, db_info in self.db_connections.items():
-            db_summary += f"- {db_name}: {db_info['path']} ({db_info['size']})\n"
-            db_summary += f"  Tables: {', '.join(db_info['tables'])}\n"
+            lines.append(f"- {db_name}: {db_info['path']} ({db_info['size']})")
+            lines.append(f"  Tables: {', '.join(db_info['tables'])}")
         
-        self.status_var.set(db_summary)
+        self.status_var.set("\n".join(lines) + "\n")
         return True
 
     def load_database(self, db_path=None):
         if not self.check_all_databases():
             self.status_var.set("Failed to find any usable databases")
             return False
-        
+
+        self.actor_id_cache.clear()
+
+        # Index building and the stats queries can take seconds on a large
+        # database, so they run off the Tk thread and the window stays live.
+        # Searches fall back to LIKE until the name index is ready.
+        self.status_var.set("Loading database(s)...")
+        self.db_executor.submit(self._load_database_bg)
+        return True
+
+    def _load_database_bg(self):
+        """Background half of load_database; hands its results to the Tk thread"""
+        # Only path finding needs the co-star graph, so it is (re)built on
+        # first use instead of on every load/refresh
+        with self._graph_lock:
+            self.graph.clear()
+            self._graph_loaded = False
         try:
-            if self.build_graph_from_database():
-                self.update_stats()
-                self.status_var.set(f"Database(s) loaded successfully")
-                return True
-            else:
-                self.status_var.set("No data loaded from databases")
-                return False
+            if 'actors' in self.db_connections:
+                self._prepare_actors_db(self.db_connections['actors'])
+            stats = self._query_stats()
         except Exception as e:
-            self.status_var.set(f"Error loading database: {str(e)}")
-            messagebox.showerror("Database Error", f"Error loading database: {str(e)}")
+            self._post(self._show_load_error, e)
+            return
+        self._post(self._finish_load, stats)
+
+    def _finish_load(self, stats):
+        self._show_stats(stats)
+        self.status_var.set(f"Database(s) loaded successfully")
+
+    def _show_load_error(self, e):
+        self.status_var.set(f"Error loading database: {str(e)}")
+        messagebox.showerror("Database Error", f"Error loading database: {str(e)}")
+
+    def _idle_connections(self, db_path):
+        """The pool of idle connections to db_path. It is a stack, so the most
+        recently used connection, whose page cache is warmest, is reused first."""
+        idle = self.db_pool.get(db_path)
+        if idle is None:
+            idle = self.db_pool.setdefault(db_path, queue.LifoQueue())
+        return idle
+
+    def _acquire_db(self, db_path):
+        """An idle pooled connection to db_path, or a new one if none is free.
+        Hand it back with _release_db instead of closing it."""
+        try:
+            return self._idle_connections(db_path).get_nowait()
+        except queue.Empty:
+            return _connect(db_path)
+
+    def _release_db(self, db_path, conn):
+        """Return a connection from _acquire_db to the pool for reuse"""
+        self._idle_connections(db_path).put(conn)
+
+    def close_app(self):
+        """Stop background work, close the pooled connections and the window.
+
+        The executor threads aren't daemons, so queued work is cancelled and
+        the running credit load or search is told to stop early; otherwise
+        the interpreter would wait for all of it after the window is gone.
+        Whatever still finishes drops its UI updates, see _post.
+        """
+        self._closing = True
+        self._search_generation += 1
+        self._credits_generation += 1
+        self.db_executor.shutdown(wait=False, cancel_futures=True)
+        self.image_executor.shutdown(wait=False, cancel_futures=True)
+        self._close_db_pool()
+        self.root.destroy()
+
+    def _post(self, callback, *args):
+        """Run callback on the Tk thread; how worker threads hand results to
+        the UI. Dropped once close_app has started, since a worker can still
+        be finishing after the window is destroyed."""
+        if self._closing:
+            return
+        try:
+            self.root.after(0, callback, *args)
+        except (tk.TclError, RuntimeError):
+            # The window went away between the check and the call
+            pass
+
+    def _close_db_pool(self):
+        """Close every idle pooled connection"""
+        pool, self.db_pool = self.db_pool, {}
+        for idle in pool.values():
+            while not idle.empty():
+                idle.get_nowait().close()
+
+    def _prepare_actors_db(self, db_info):
+        """Create the indexes and FTS5 name index used by interactive queries.
+
+        Best effort: a read-only database or a SQLite build without FTS5 just
+        keeps the slower query plans (actor search falls back to LIKE).
+        """
+        with self._prepare_lock:
+            db_path = db_info['path']
+            checked_mtime = self.fts_ready.pop(db_path, None)
+            conn = self._acquire_db(db_path)
+            cursor = conn.cursor()
+
+            try:
+                for table, statement in ACTOR_DB_INDEXES:
+                    if table in db_info['tables']:
+                        cursor.execute(statement)
+
+                # Without statistics the planner can't tell the (id, actor_id)
+                # primary key from the actor_id index when joining credits on
+                # both, so gather them once per database
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'")
+                if not cursor.fetchone():
+                    cursor.execute("ANALYZE")
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"Could not create database indexes: {str(e)}")
+
+            try:
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='actors_fts'")
+                if not cursor.fetchone():
+                    cursor.execute("""
+                        CREATE VIRTUAL TABLE actors_fts USING fts5(
+                            name, content='actors', content_rowid='id',
+                            tokenize='unicode61 remove_diacritics 2'
+                        )
+                    """)
+                    rebuild = True
+                elif checked_mtime is not None and checked_mtime == os.path.getmtime(db_path):
+                    rebuild = False
+                else:
+                    # The index only mirrors the actors table, so an update run
+                    # that rewrote actors leaves it stale; compare it with the
+                    # table and rebuild it if they differ
+                    try:
+                        cursor.execute("INSERT INTO actors_fts(actors_fts, rank) VALUES('integrity-check', 1)")
+                        rebuild = False
+                    except sqlite3.Error:
+                        rebuild = True
+                if rebuild:
+                    self._post(self.status_var.set, "Building actor name search index...")
+                    cursor.execute("INSERT INTO actors_fts(actors_fts) VALUES('rebuild')")
+                conn.commit()
+
+                self.fts_ready[db_path] = os.path.getmtime(db_path)
+            except sqlite3.Error as e:
+                print(f"Actor search index unavailable, using LIKE search: {str(e)}")
+
+            self._release_db(db_path, conn)
+
+    def _fts_current(self, db_path):
+        """True if the database file is unchanged since its actors_fts index
+        was last checked against the actors table"""
+        try:
+            return self.fts_ready.get(db_path) == os.path.getmtime(db_path)
+        except OSError:
             return False
 
+    def _search_actors_by_name(self, cursor, db_path, name, limit=100):
+        """Return (id, name, popularity) rows matching name, most popular first.
+
+        A name index that may be stale is skipped in favour of LIKE.
+        """
+        if self._fts_current(db_path) and name.split():
+            cursor.execute(SQL_SEARCH_ACTORS_FTS, (_fts_prefix_query(name), limit))
+            results = cursor.fetchall()
+            if results:
+                return results
+
+        # Substring matches inside a word are not covered by the prefix index
+        cursor.execute(SQL_SEARCH_ACTORS_LIKE, (f"%{name}%", limit))
+        return cursor.fetchall()
+
+    def _ensure_graph(self):
+        """Build the graph if it hasn't been loaded yet or a database file it
+        was built from has changed since; False if no data could be loaded.
+
+        Runs on db_executor with _graph_lock held, since the build can take
+        seconds on a large database.
+        """
+        mtimes = self._graph_database_mtimes()
+        if not self._graph_loaded or mtimes != self._graph_mtimes:
+            if self._graph_mtimes and mtimes != self._graph_mtimes:
+                self._close_db_pool()
+                # Names resolved against the old file may no longer match;
+                # the cache is only used on the Tk thread, so clear it there
+                self._post(self.actor_id_cache.clear)
+            self._graph_mtimes = mtimes
+            self._graph_loaded = False
+            self._graph_loaded = self.build_graph_from_database()
+        return self._graph_loaded
+
+    def _graph_database_mtimes(self):
+        """Modification time of each database file the graph is built from"""
+        mtimes = {}
+        for key in ('actors', 'actor_connections'):
+            if key in self.db_connections:
+                try:
+                    mtimes[key] = os.path.getmtime(self.db_connections[key]['path'])
+                except OSError:
+                    mtimes[key] = None
+        return mtimes
+
     def build_graph_from_database(self):
-        """Build the graph using the actors and actor_connections tables."""
+        """Build the graph using the actors and actor_connections tables.
+
+        Runs on db_executor, so status updates are posted to the Tk thread.
+        """
         self.graph.clear()
         actors_loaded = False
         connections_loaded = False
+        actor_count = 0
         
         try:
             # First load actors from actors.db
             if 'actors' in self.db_connections:
                 actor_db_path = self.db_connections['actors']['path']
-                self.status_var.set(f"Loading actors from {actor_db_path}...")
-                self.root.update_idletasks()
+                self._post(self.status_var.set, f"Loading actors from {actor_db_path}...")
                 
-                conn = sqlite3.connect(actor_db_path)
+                conn = self._acquire_db(actor_db_path)
                 cursor = conn.cursor()
                 
                 # Check if 'actors' table exists
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='actors'")
                 if cursor.fetchone():
-                    cursor.execute("SELECT id, name, profile_path, popularity, place_of_birth FROM actors")
-                    for actor_id, name, profile_path, popularity, place_of_birth in cursor.fetchall():
-                        self.graph.add_node(actor_id, 
-                                            type="actor", 
-                                            name=name, 
-                                            profile_path=profile_path,
-                                            popularity=popularity,
-                                            place_of_birth=place_of_birth)
+                    # Rows stream from the cursor straight into the node dict. Path
+                    # rendering reads names and profile images and co-star lists
+                    # rank by popularity; the stats and details views query the
+                    # rest from SQLite when shown.
+                    cursor.execute("SELECT id, name, profile_path, popularity FROM actors")
+                    self.graph.add_nodes_from(
+                        (actor_id, {'name': name, 'profile_path': profile_path, 'popularity': popularity})
+                        for actor_id, name, profile_path, popularity in cursor
+                    )
+                    actor_count = len(self.graph.nodes)
                     actors_loaded = True
-                    self.status_var.set(f"Loaded actor data from {actor_db_path}")
+                    self._post(self.status_var.set, f"Loaded actor data from {actor_db_path}")
                     
                     # Now, build common movie/TV connections between actors
                     self._build_movie_connections(conn)
                 else:
-                    self.status_var.set(f"No 'actors' table found in {actor_db_path}")
+                    self._post(self.status_var.set, f"No 'actors' table found in {actor_db_path}")
                 
-                conn.close()
+                self._release_db(actor_db_path, conn)
             else:
-                self.status_var.set("No actors database found")
+                self._post(self.status_var.set, "No actors database found")
             
             # Then load pre-computed connections from actor_connections.db
             if 'actor_connections' in self.db_connections:
                 conn_db_path = self.db_connections['actor_connections']['path']
-                self.status_var.set(f"Loading actor connections from {conn_db_path}...")
-                self.root.update_idletasks()
+                self._post(self.status_var.set, f"Loading actor connections from {conn_db_path}...")
                 
-                conn = sqlite3.connect(conn_db_path)
+                conn = self._acquire_db(conn_db_path)
                 cursor = conn.cursor()
                 
                 # First try the expected table name
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='actor_connections'")
                 if cursor.fetchone():
-                    cursor.execute("SELECT start_id, target_id, connection_length, optimal_path, difficulty FROM actor_connections")
-                    for start_id, target_id, connection_length, optimal_path, difficulty in cursor.fetchall():
-                        if self.graph.has_node(int(start_id)) and self.graph.has_node(int(target_id)):
-                            # Only add these pre-computed connections if we're missing a direct connection
-                            # This ensures pre-computed paths override any incorrect ones
-                            self.graph.add_edge(int(start_id), int(target_id), 
-                                              connection_length=connection_length,
-                                              optimal_path=optimal_path, 
-                                              difficulty=difficulty,
-                                              is_precomputed=True)
+                    # Pre-computed connections carry no credits, so they are kept
+                    # beside the co-star edges rather than searched as edges. Only
+                    # the pairs stay in memory; a path blob is read when it's used.
+                    # Pairs are only usable between loaded actors, so the actors
+                    # database is attached and SQLite drops the rest.
+                    if actors_loaded:
+                        cursor.execute("ATTACH DATABASE ? AS actors_db", (self.db_connections['actors']['path'],))
+                        try:
+                            cursor.execute(SQL_PRECOMPUTED_PAIRS)
+                            self.graph.precomputed.update(cursor)
+                        finally:
+                            cursor.execute("DETACH DATABASE actors_db")
                     connections_loaded = True
-                    self.status_var.set(f"Loaded connection data from {conn_db_path}")
+                    self._post(self.status_var.set, f"Loaded connection data from {conn_db_path}")
                 
-                conn.close()
+                self._release_db(conn_db_path, conn)
             else:
-                self.status_var.set("No connections database found")
+                self._post(self.status_var.set, "No connections database found")
             
-            # Update status with count information
-            actor_count = len([n for n, d in self.graph.nodes(data=True) if d.get('type') == 'actor'])
-            edge_count = self.graph.number_of_edges()
+            # Update status with count information (actors were counted as they were added)
+            edge_count = len(self.graph.precomputed)
             
             status_msg = []
             if actors_loaded:
-                status_msg.append(f"{actor_count} actors")
+                status_msg.append(f"{actor_count} actors ({self.graph.number_of_credits()} credits)")
             if connections_loaded:
                 status_msg.append(f"{edge_count} connections")
             
             if status_msg:
-                self.status_var.set(f"Loaded {' and '.join(status_msg)}")
+                self._post(self.status_var.set, f"Loaded {' and '.join(status_msg)}")
             else:
-                self.status_var.set("No data loaded - check database structure")
+                self._post(self.status_var.set, "No data loaded - check database structure")
             
         except Exception as e:
             import traceback
             tb = traceback.format_exc()
-            self.status_var.set(f"Error loading database: {str(e)}")
-            messagebox.showerror("Database Error", f"Could not load database: {str(e)}\n\n{tb}")
+            self._post(self.status_var.set, f"Error loading database: {str(e)}")
+            self._post(messagebox.showerror, "Database Error", f"Could not load database: {str(e)}\n\n{tb}")
             return False
         
         return actors_loaded or connections_loaded
 
     def _build_movie_connections(self, conn):
         """Build graph edges based on actors appearing in the same movies/TV shows"""
-        self.status_var.set("Building movie and TV connections...")
-        self.root.update_idletasks()
+        self._post(self.status_var.set, "Building movie and TV connections...")
         
         cursor = conn.cursor()
-        
-        # Check if movie_credits table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='movie_credits'")
-        if cursor.fetchone():
-            # Create a dictionary mapping each movie to actors
-            # MODIFIED: Added character filter to exclude self-appearances
-            cursor.execute("""
-                SELECT id, actor_id, title, character 
-                FROM movie_credits 
-                WHERE LOWER(character) NOT IN ('self', 'himself', 'herself')
-                AND character NOT LIKE 'self%'
-                AND character IS NOT NULL
-                AND character != ''
-            """)
-            
-            movies_to_actors = {}
-            for movie_id, actor_id, title, character in cursor.fetchall():
-                # Skip any character that matches the actor's name (self-appearance)
-                if self.graph.has_node(actor_id) and character == self.graph.nodes[actor_id].get('name'):
-                    continue
-                    
-                if movie_id not in movies_to_actors:
-                    movies_to_actors[movie_id] = []
-                movies_to_actors[movie_id].append(actor_id)
-            
-            # Create edges for actors who appeared in the same movie
-            for movie_id, actors in movies_to_actors.items():
-                for i in range(len(actors)):
-                    for j in range(i+1, len(actors)):
-                        actor1, actor2 = actors[i], actors[j]
-                        if self.graph.has_edge(actor1, actor2):
-                            # Update existing edge
-                            self.graph[actor1][actor2]['weight'] += 1
-                            self.graph[actor1][actor2]['credits'].append(movie_id)
-                        else:
-                            # Create new edge
-                            self.graph.add_edge(actor1, actor2, 
-                                               weight=1, 
-                                               credits=[movie_id],
-                                               connection_type='movie')
-        
-        # Check if tv_credits table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='tv_credits'")
-        if cursor.fetchone():
-            # Create a dictionary mapping each TV show to actors
-            # MODIFIED: Added character filter to exclude self-appearances
-            cursor.execute("""
-                SELECT id, actor_id, name, character 
-                FROM tv_credits 
-                WHERE LOWER(character) NOT IN ('self', 'himself', 'herself')
-                AND character NOT LIKE 'self%'
-                AND character IS NOT NULL
-                AND character != ''
-            """)
-            
-            tv_to_actors = {}
-            for tv_id, actor_id, name, character in cursor.fetchall():
-                # Skip any character that matches the actor's name (self-appearance)
-                if self.graph.has_node(actor_id) and character == self.graph.nodes[actor_id].get('name'):
-                    continue
-                    
-                if tv_id not in tv_to_actors:
-                    tv_to_actors[tv_id] = []
-                tv_to_actors[tv_id].append(actor_id)
-            
-            # Create edges for actors who appeared in the same TV show
-            for tv_id, actors in tv_to_actors.items():
-                for i in range(len(actors)):
-                    for j in range(i+1, len(actors)):
-                        actor1, actor2 = actors[i], actors[j]
-                        if self.graph.has_edge(actor1, actor2):
-                            # Update existing edge
-                            self.graph[actor1][actor2]['weight'] += 1
-                            self.graph[actor1][actor2]['credits'].append(tv_id)
-                        else:
-                            # Create new edge
-                            self.graph.add_edge(actor1, actor2, 
-                                               weight=1, 
-                                               credits=[tv_id],
-                                               connection_type='tv')
-        
-        # Print the number of connections created
-        edge_count = self.graph.number_of_edges()
-        self.status_var.set(f"Built {edge_count} connections between actors")
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name IN ('movie_credits', 'tv_credits')")
+        tables = {row[0] for row in cursor.fetchall()}
+        
+        # One (actor_id, title_id, is_tv, is_mcu) row per usable credit, read in
+        # a single query; actors sharing a title are co-stars
+        selects = [SQL_GRAPH_CREDITS.format(table=table, is_tv=is_tv)
+                   for table, is_tv in (("movie_credits", 0), ("tv_credits", 1)) if table in tables]
+        credit_rows = []
+        if selects:
+            # Rows stream from the cursor into one flat int64 buffer, so no
+            # list of hundreds of thousands of tuples is held alongside it
+            cursor.execute(" UNION ALL ".join(selects))
+            credit_rows = np.fromiter(chain.from_iterable(cursor), dtype=np.int64)
+        
+        self.graph.set_credits(credit_rows)
+        
+        # Print the number of credits linking actors
+        self._post(self.status_var.set, f"Linked {self.graph.number_of_credits()} credits across "
+                                        f"{len(self.graph.title_ids)} movies and TV shows")
 
     # Core functionality methods
     def search_actors_for(self, target_type):
@@ -705,18 +1351,25 @@ class ActorToActorApp:
         self._show_actor_search_dialog(name, target_type)
     
     def search_actors(self):
-        # Creates a dialog for searching actors
-        threading.Thread(target=self._perform_actor_search, daemon=True).start()
+        """Search in the background; a newer search supersedes this one"""
+        self._search_generation += 1
+        # A search still queued behind other work is superseded by this one
+        if self._search_future is not None:
+            self._search_future.cancel()
+        self._search_future = self.db_executor.submit(
+            self._perform_actor_search, self.actor_search_entry.get().strip(), self._search_generation)
     
-    def _perform_actor_search(self):
-        """Search for actors by name and display results in the tree view"""
-        search_term = self.actor_search_entry.get().strip()
+    def _perform_actor_search(self, search_term, generation):
+        """Search for actors by name and display results in the tree view.
+
+        Results are dropped if a newer search has started in the meantime.
+        """
         if not search_term:
-            self.root.after(0, lambda: self.status_var.set("Please enter a search term"))
+            self._post(lambda: self.status_var.set("Please enter a search term"))
             return
         
-        self.root.after(0, lambda: self.status_var.set(f"Searching for '{search_term}'..."))
-        self.root.after(0, lambda: self.actor_tree.delete(*self.actor_tree.get_children()))
+        self._post(lambda: self.status_var.set(f"Searching for '{search_term}'..."))
+        self._post(lambda: self.actor_tree.delete(*self.actor_tree.get_children()))
         
         try:
             # Find database with actors table
@@ -731,42 +1384,49 @@ class ActorToActorApp:
                         break
             
             if not db_path:
-                self.root.after(0, lambda: self.status_var.set("No database with actors table found"))
+                self._post(lambda: self.status_var.set("No database with actors table found"))
                 return
-                
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
             
-            # Use LIKE for case-insensitive partial matching
-            cursor.execute("""
-                SELECT id, name, popularity 
-                FROM actors 
-                WHERE name LIKE ? 
-                ORDER BY popularity DESC
-                LIMIT 100
-            """, (f"%{search_term}%",))
+            if generation != self._search_generation:
+                return
             
-            results = cursor.fetchall()
-            conn.close()
+            # The database changed since its name index was checked, e.g. by
+            # an update run, so bring the index up to date before searching
+            if db_path in self.fts_ready and not self._fts_current(db_path) and 'actors' in self.db_connections:
+                self._prepare_actors_db(self.db_connections['actors'])
+                
+            conn = self._acquire_db(db_path)
+            cursor = conn.cursor()
+
+            results = self._search_actors_by_name(cursor, db_path, search_term)
+
+            # Profile paths of the top results, so their images can be prefetched
+            top_ids = [row[0] for row in results[:PREFETCH_IMAGE_COUNT]]
+            cursor.execute(SQL_PREFETCH_PROFILE_PATHS, top_ids + [None] * (PREFETCH_IMAGE_COUNT - len(top_ids)))
+            profile_paths = [row[0] for row in cursor.fetchall()]
+            self._release_db(db_path, conn)
             
             # Update UI in the main thread
             def update_ui():
+                if generation != self._search_generation:
+                    return
                 if not results:
                     self.status_var.set(f"No actors found matching '{search_term}'")
                     return
                     
-                for actor_id, name, popularity in results:
-                    self.actor_tree.insert("", "end", values=(actor_id, name, f"{popularity:.1f}"))
+                _bulk_insert(self.actor_tree, [(actor_id, name, f"{popularity:.1f}")
+                                               for actor_id, name, popularity in results])
                     
                 self.status_var.set(f"Found {len(results)} actors matching '{search_term}'")
+                self._prefetch_profile_images(profile_paths)
             
-            self.root.after(0, update_ui)
+            self._post(update_ui)
             
         except Exception as e:
             import traceback
             tb = traceback.format_exc()
             print(f"Error searching actors: {str(e)}\n{tb}")
-            self.root.after(0, lambda: self.status_var.set(f"Error searching: {str(e)}"))
+            self._post(lambda: self.status_var.set(f"Error searching: {str(e)}"))
 
     def show_actor_details(self, event=None):
         selected_items = self.actor_tree.selection()
@@ -780,20 +1440,35 @@ class ActorToActorApp:
         self.current_actor_id = actor_id
         
         try:
-            # Get actor details from graph
-            if self.graph.has_node(int(actor_id)):
-                actor_data = self.graph.nodes[int(actor_id)]
-                self.actor_name_label.config(text=actor_data.get('name', 'Unknown'))
+            # Get database path
+            if 'actors' in self.db_connections:
+                db_path = self.db_connections['actors']['path']
+            else:
+                db_paths = list(self.db_connections.values())
+                if db_paths:
+                    db_path = db_paths[0]['path']
+                else:
+                    self.status_var.set("No database found for actor credits")
+                    return
+
+            # Get actor details straight from the database, the graph may not be built yet
+            conn = self._acquire_db(db_path)
+            actor_row = conn.execute(SQL_ACTOR_BY_ID, (int(actor_id),)).fetchone()
+            self._release_db(db_path, conn)
+
+            if actor_row:
+                name, profile_path, popularity, place_of_birth = actor_row
+                self.actor_name_label.config(text=name or 'Unknown')
                 self.actor_id_label.config(text=f"ID: {actor_id}")
-                self.actor_popularity_label.config(text=f"Popularity: {actor_data.get('popularity', 'N/A')}")
+                self.actor_popularity_label.config(
+                    text=f"Popularity: {popularity if popularity is not None else 'N/A'}")
                 
-                if actor_data.get('place_of_birth'):
-                    self.actor_birth_label.config(text=f"Born: {actor_data.get('place_of_birth', 'N/A')}")
+                if place_of_birth:
+                    self.actor_birth_label.config(text=f"Born: {place_of_birth}")
                 else:
                     self.actor_birth_label.config(text="")
                 
                 # Try to load image
-                profile_path = actor_data.get('profile_path')
                 self.load_actor_image(profile_path)
                 
                 # Clear existing credits
@@ -801,23 +1476,14 @@ class ActorToActorApp:
                 self.tv_tree.delete(*self.tv_tree.get_children())
                 self.costars_tree.delete(*self.costars_tree.get_children())
                 
-                # Get database path
-                if 'actors' in self.db_connections:
-                    db_path = self.db_connections['actors']['path']
-                else:
-                    db_paths = list(self.db_connections.values())
-                    if db_paths:
-                        db_path = db_paths[0]['path']
-                    else:
-                        self.status_var.set("No database found for actor credits")
-                        return
-                
-                # Load credits in background thread
-                threading.Thread(
-                    target=self._load_actor_credits, 
-                    args=(actor_id, db_path),
-                    daemon=True
-                ).start()
+                # Load credits in the background; a previously clicked actor's
+                # credits that haven't started loading would only be cleared again,
+                # and rows of one already loading are dropped by generation
+                if self._credits_future is not None:
+                    self._credits_future.cancel()
+                self._credits_generation += 1
+                self._credits_future = self.db_executor.submit(
+                    self._load_actor_credits, actor_id, db_path, self._credits_generation)
             else:
                 messagebox.showerror("Actor Not Found", f"Actor with ID {actor_id} not found in database")
         except Exception as e:
@@ -828,165 +1494,249 @@ class ActorToActorApp:
 
     def load_actor_image(self, profile_path, size=(185, 278)):
         """Load actor profile image from TMDB and display it"""
+        # Remember which image the label is waiting for, so a slow download
+        # doesn't overwrite the photo of an actor selected after it
+        self.actor_image_label.pending_profile = profile_path
+        
         if not profile_path:
             # Set a placeholder image for actors without photos
             self.actor_image_label.config(image="")
             return
             
         # Check if image is already cached
-        if profile_path in self.image_cache:
-            self.actor_image_label.config(image=self.image_cache[profile_path])
+        cached = self._get_cached_image(profile_path, size)
+        if cached is not None:
+            self.actor_image_label.config(image=cached)
             return
             
+        # Download and shrink on the shared image pool; the PhotoImage is made
+        # on the Tk thread
+        future = self.image_executor.submit(self._fetch_thumbnail, self._profile_image_url(profile_path), size)
+        future.add_done_callback(
+            lambda f: self._post(self._show_fetched_image, self.actor_image_label, profile_path, size, f))
+
+    def _show_fetched_image(self, label, profile_path, size, future):
+        """Cache a downloaded thumbnail and show it on label if the label is
+        still waiting for this profile image; returns the PhotoImage shown"""
+        if future.exception() is not None:
+            # Not critical, and the full error would clutter the output
+            print(f"Non-critical: Image loading error for {profile_path}: {str(future.exception())}")
+        photo = None
+        if future.exception() is None and future.result() is not None:
+            photo = ImageTk.PhotoImage(future.result())
+            self._cache_image(profile_path, size, photo)
+        if getattr(label, 'pending_profile', None) != profile_path:
+            return
+        label.config(image=photo or "")
+        label.image = photo  # Keep a reference
+        return photo
+
+    def _profile_image_url(self, profile_path):
+        """Full w185 TMDB URL for a profile path (paths may already be absolute URLs)"""
+        if profile_path.startswith('http'):
+            return profile_path
+        return f"https://image.tmdb.org/t/p/w185{profile_path}"
+
+    def _prefetch_profile_images(self, profile_paths, size=(185, 278)):
+        """Download the given profile images in the background so clicking
+        through search results finds them already cached"""
+        for profile_path in profile_paths:
+            if not profile_path or self._get_cached_image(profile_path, size) is not None:
+                continue
+
+            future = self.image_executor.submit(self._fetch_thumbnail,
+                                                self._profile_image_url(profile_path), size)
+            future.add_done_callback(
+                lambda f, path=profile_path: self._post(self._cache_prefetched_image, path, size, f))
+
+    def _fetch_thumbnail(self, url, size):
+        """Worker task: download an image and shrink it to size (None on failure).
+
+        Images downloaded before, in this run or an earlier one, are read from
+        the disk cache instead.
+        """
+        data = self._read_disk_image(url)
+        if data is None:
+            response = self.http.get(url, timeout=10)
+            if response.status_code != 200:
+                return None
+            data = response.content
+            self._write_disk_image(url, data)
+        img = Image.open(io.BytesIO(data))
+        # JPEGs are decoded at the smallest libjpeg scale still at least size,
+        # so most of the full-resolution decode is skipped; a no-op otherwise
+        img.draft('RGB', size)
+        img.thumbnail(size, Image.Resampling.BILINEAR)
+        return img
+
+    def _disk_image_path(self, url):
+        """Disk cache file for an image URL"""
+        return os.path.join(IMAGE_DISK_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".img")
+
+    def _read_disk_image(self, url):
+        """Bytes of a cached download, marked recently used, or None"""
+        path = self._disk_image_path(url)
         try:
-            # TMDB image base URL
-            image_base_url = "https://image.tmdb.org/t/p/w185"
-            if not profile_path.startswith('http'):
-                # Construct full URL if just a path is provided
-                image_url = f"{image_base_url}{profile_path}"
-            else:
-                image_url = profile_path
-                
-            # Download image in a background thread
-            threading.Thread(target=self._download_and_display_image, 
-                           args=(image_url, profile_path, size),
-                           daemon=True).start()
-        except Exception as e:
-            print(f"Error loading image: {str(e)}")
-            self.actor_image_label.config(image="")
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
 
-    def _download_and_display_image(self, url, profile_path, size):
-        """Background task to download and process actor image"""
+    def _write_disk_image(self, url, data):
+        """Save a download to the disk cache, evicting the least recently used
+        files once it grows past IMAGE_DISK_CACHE_BYTES. Best effort."""
+        path = self._disk_image_path(url)
+        # Workers may save the same image at once, so each writes its own
+        # file and renames it into place
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
         try:
-            # Download image with longer timeout (10 seconds)
-            response = requests.get(url, timeout=10)  # Increase from 3 to 10
-            if response.status_code == 200:
-                # Load image from response data
-                img_data = response.content
-                img = Image.open(io.BytesIO(img_data))
-                
-                # Resize image while preserving aspect ratio
-                img.thumbnail(size)
-                
-                # Convert to Tkinter PhotoImage
-                tk_img = ImageTk.PhotoImage(img)
-                
-                # Cache the image and update the UI in the main thread
-                self.image_cache[profile_path] = tk_img
-                self.root.after(0, lambda: self.actor_image_label.config(image=tk_img))
-            else:
-                self.root.after(0, lambda: self.actor_image_label.config(image=""))
-        except Exception as e:
-            print(f"Non-critical: Image loading error for {url[:30]}...: {str(e)}")
-            # Don't show the full error, it's not critical and clutters the output
-            self.root.after(0, lambda: self.actor_image_label.config(image=""))
+            os.makedirs(IMAGE_DISK_CACHE_DIR, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Non-critical: Could not cache image on disk: {str(e)}")
+            return
+
+        with self._disk_cache_lock:
+            if self._disk_cache_bytes is not None:
+                self._disk_cache_bytes += len(data)
+            if self._disk_cache_bytes is None or self._disk_cache_bytes > IMAGE_DISK_CACHE_BYTES:
+                self._trim_disk_images()
+
+    def _trim_disk_images(self):
+        """Recount the disk cache and, once it is over IMAGE_DISK_CACHE_BYTES,
+        remove the least recently used files until it is under 90% of the cap
+        so the next few writes don't rescan it. Called with _disk_cache_lock held."""
+        files = []
+        try:
+            for entry in os.scandir(IMAGE_DISK_CACHE_DIR):
+                try:
+                    files.append((entry.stat(), entry.path))
+                except OSError:
+                    pass  # another worker's temp file, renamed since the scan
+        except OSError:
+            return
+        total = sum(stat.st_size for stat, _ in files)
+        if total > IMAGE_DISK_CACHE_BYTES:
+            files.sort(key=lambda item: item[0].st_mtime)
+            for stat, path in files:
+                if total <= IMAGE_DISK_CACHE_BYTES * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= stat.st_size
+        self._disk_cache_bytes = total
+
+    def _cache_prefetched_image(self, profile_path, size, future):
+        """Convert a prefetched thumbnail to a PhotoImage on the Tk thread and cache it"""
+        if future.exception() is not None or future.result() is None:
+            return
+        self._cache_image(profile_path, size, ImageTk.PhotoImage(future.result()))
 
-    def _load_actor_credits(self, actor_id, db_path):
-        """Load movie and TV credits for an actor"""
-        self.status_var.set(f"Loading credits for actor {actor_id}...")
+    def _get_cached_image(self, profile_path, size):
+        """Return a cached PhotoImage for this profile/size, marking it recently used"""
+        key = (profile_path, tuple(size))
+        image = self.image_cache.get(key)
+        if image is not None:
+            self.image_cache.move_to_end(key)
+        return image
+
+    def _cache_image(self, profile_path, size, image):
+        """Cache a PhotoImage, evicting the least recently used beyond IMAGE_CACHE_SIZE"""
+        key = (profile_path, tuple(size))
+        self.image_cache[key] = image
+        self.image_cache.move_to_end(key)
+        while len(self.image_cache) > IMAGE_CACHE_SIZE:
+            self.image_cache.popitem(last=False)
+
+    def _load_actor_credits(self, actor_id, db_path, generation):
+        """Load movie and TV credits for an actor.
+
+        Rows are only shown while generation is still the latest credit load,
+        so a slower load for a previously clicked actor can't mix into the lists.
+        """
+        self._post(self.status_var.set, f"Loading credits for actor {actor_id}...")
         
         try:
-            conn = sqlite3.connect(db_path)
+            conn = self._acquire_db(db_path)
             cursor = conn.cursor()
             
-            # Load movie credits
-            cursor.execute("""
-                SELECT id, title, character, release_date 
-                FROM movie_credits 
-                WHERE actor_id = ? 
-                ORDER BY release_date DESC
-            """, (actor_id,))
-            movies = cursor.fetchall()
-            
-            # Filter out unwanted credits
-            filtered_movies = [
-                movie for movie in movies
-                if movie[2] and
-                   not any(
-                       s in movie[2].lower()
-                       for s in [
-                           "himself", "herself", "self", "archive", "archival", "stock footage", "final cut"
-                       ]
-                   )
-            ]
-
-            for movie in filtered_movies:
-                movie_id, title, character, release_date = movie
-                year = release_date[:4] if release_date and len(release_date) >= 4 else "N/A"
-                def add_movie(mid=movie_id, mtitle=title, mchar=character, myear=year):
-                    self.movies_tree.insert("", "end", values=(mid, mtitle, mchar, myear))
-                self.root.after(0, add_movie)
+            # Load movie credits, filtering out unwanted credits
+            cursor.execute(SQL_MOVIE_CREDITS, (actor_id,))
+            movie_count = self._stream_rows(cursor, self.movies_tree, _credit_rows, generation)
             
             # Load TV credits
-            cursor.execute("""
-                SELECT id, name, character, first_air_date 
-                FROM tv_credits 
-                WHERE actor_id = ? 
-                ORDER BY first_air_date DESC
-            """, (actor_id,))
-            tv_shows = cursor.fetchall()
-
-            filtered_tv = [
-                show for show in tv_shows
-                if show[2] and
-                   not any(
-                       s in show[2].lower()
-                       for s in [
-                           "himself", "herself", "self", "archive", "archival", "stock footage", "final cut"
-                       ]
-                   )
-            ]
-
-            for show in filtered_tv:
-                show_id, name, character, first_air_date = show
-                year = first_air_date[:4] if first_air_date and len(first_air_date) >= 4 else "N/A"
-                def add_show(sid=show_id, sname=name, schar=character, syear=year):
-                    self.tv_tree.insert("", "end", values=(sid, sname, schar, syear))
-                self.root.after(0, add_show)
+            cursor.execute(SQL_TV_CREDITS, (actor_id,))
+            tv_count = self._stream_rows(cursor, self.tv_tree, _credit_rows, generation)
             
             # Load co-stars (optional)
-            self._load_costars(actor_id, conn)
+            self._load_costars(actor_id, conn, generation)
             
-            conn.close()
-            self.root.after(0, lambda: self.status_var.set(
-                f"Loaded {len(movies)} movies and {len(tv_shows)} TV shows for {actor_id}"))
+            self._release_db(db_path, conn)
+            def show_loaded():
+                if generation == self._credits_generation:
+                    self.status_var.set(f"Loaded {movie_count} movies and {tv_count} TV shows for {actor_id}")
+            self._post(show_loaded)
             
         except Exception as e:
             import traceback
             tb = traceback.format_exc()
-            self.root.after(0, lambda: self.status_var.set(f"Error loading credits: {str(e)}"))
+            self._post(lambda: self.status_var.set(f"Error loading credits: {str(e)}"))
             print(f"Error loading credits: {str(e)}\n{tb}")
 
-    def _load_costars(self, actor_id, conn):
+    def _stream_rows(self, cursor, tree, make_rows, generation):
+        """Append a query's results to a Treeview a CREDIT_FETCH_SIZE chunk at a
+        time, so the first rows show while the rest are still being read.
+
+        Stops once a newer credit load than generation has started. Returns
+        the number of rows read, before make_rows filters.
+        """
+        cursor.arraysize = CREDIT_FETCH_SIZE
+        count = 0
+        while generation == self._credits_generation:
+            chunk = cursor.fetchmany()
+            if not chunk:
+                break
+            count += len(chunk)
+            self._post(self._insert_credit_rows, tree, make_rows(chunk), generation)
+        return count
+
+    def _insert_credit_rows(self, tree, rows, generation):
+        """Tk-thread half of _stream_rows: append rows unless a newer credit
+        load has cleared the trees since they were read"""
+        if generation == self._credits_generation:
+            _bulk_insert(tree, rows)
+
+    def _load_costars(self, actor_id, conn, generation):
         """Load co-stars for an actor"""
         try:
+            # Once path finding has built the graph it already holds every
+            # shared credit, so the co-stars are counted from it in memory.
+            # While the graph is being cleared or rebuilt, SQLite is used.
+            costars = None
+            if self._graph_lock.acquire(blocking=False):
+                try:
+                    if self._graph_loaded and int(actor_id) in self.graph:
+                        costars = []
+                        for costar_id, movie_count in self.graph.costars(int(actor_id)):
+                            attrs = self.graph.nodes[costar_id]
+                            costars.append((costar_id, attrs.get('name'), movie_count,
+                                            attrs.get('popularity') or 0.0))
+                finally:
+                    self._graph_lock.release()
+            if costars is not None:
+                self._post(self._insert_credit_rows, self.costars_tree, _costar_rows(costars), generation)
+                return
+            
             # Find all actors who appeared in same movies
             cursor = conn.cursor()
-            cursor.execute("""
-                WITH actor_movies AS (
-                    SELECT id FROM movie_credits WHERE actor_id = ?
-                )
-                SELECT a.id, a.name, COUNT(*) as movie_count, a.popularity 
-                FROM actors a
-                JOIN movie_credits mc ON a.id = mc.actor_id
-                WHERE mc.id IN (SELECT id FROM actor_movies)
-                AND a.id != ?
-                GROUP BY a.id
-                ORDER BY movie_count DESC, a.popularity DESC
-                LIMIT 100
-            """, (actor_id, actor_id))
-            
-            costars = cursor.fetchall()
-            
-            # Add co-stars to tree - FIXED LAMBDA ISSUE
-            for costar in costars:
-                costar_id, name, movie_count, popularity = costar
-                
-                # Create copies of the values
-                def add_costar(cid=costar_id, cname=name, count=movie_count, pop=popularity):
-                    self.costars_tree.insert("", "end", values=(cid, cname, count, f"{pop:.1f}"))
-                
-                self.root.after(0, add_costar)
+            cursor.execute(SQL_COSTARS, (actor_id, actor_id))
+            self._stream_rows(cursor, self.costars_tree, _costar_rows, generation)
                 
         except Exception as e:
             print(f"Error loading co-stars: {str(e)}")
@@ -1028,8 +1778,7 @@ class ActorToActorApp:
         
         # Clear previous results
         self.results_text.delete("1.0", tk.END)
-        for widget in self.path_frame.winfo_children():
-            widget.destroy()
+        self._clear_path_frame()
             
         self.status_var.set(f"Finding path between '{start_name}' and '{target_name}'...")
         
@@ -1079,35 +1828,41 @@ class ActorToActorApp:
         depth_map = {"easy": 6, "normal": 12, "hard": 20}
         max_depth = depth_map.get(difficulty, 6)
         
-        # Start path finding in a background thread
-        threading.Thread(
-            target=self._find_shortest_path,
-            args=(int(start_id), int(target_id), (difficulty == 'hard'), 
-                 exclude_mcu, max_depth),
-            daemon=True
-        ).start()
+        # Build the graph if needed and find the path in a background thread
+        self.db_executor.submit(
+            self._find_shortest_path,
+            int(start_id), int(target_id), (difficulty == 'hard'), exclude_mcu, max_depth)
 
     def _find_actor_by_name(self, name):
         """Search for an actor by name and return their ID"""
         try:
             if 'actors' in self.db_connections:
                 db_path = self.db_connections['actors']['path']
-                conn = sqlite3.connect(db_path)
+                # Retrying a search re-submits the same names, so resolved
+                # names are remembered until the database is reloaded
+                key = (db_path, name.casefold())
+                if key in self.actor_id_cache:
+                    self.actor_id_cache.move_to_end(key)
+                    return self.actor_id_cache[key]
+                
+                conn = self._acquire_db(db_path)
                 cursor = conn.cursor()
                 
                 # Try exact match first
-                cursor.execute("SELECT id FROM actors WHERE name = ? LIMIT 1", (name,))
+                cursor.execute(SQL_ACTOR_BY_EXACT_NAME, (name,))
                 result = cursor.fetchone()
                 
-                # If no exact match, try LIKE query
+                # If no exact match, fall back to the most popular partial match
                 if not result:
-                    cursor.execute("SELECT id FROM actors WHERE name LIKE ? ORDER BY popularity DESC LIMIT 1", 
-                                  (f"%{name}%",))
-                    result = cursor.fetchone()
+                    matches = self._search_actors_by_name(cursor, db_path, name, limit=1)
+                    result = matches[0] if matches else None
                 
-                conn.close()
+                self._release_db(db_path, conn)
                 
                 if result:
+                    self.actor_id_cache[key] = result[0]
+                    while len(self.actor_id_cache) > ACTOR_ID_CACHE_SIZE:
+                        self.actor_id_cache.popitem(last=False)
                     return result[0]
                 else:
                     # If still not found, show dialog with potential matches
@@ -1117,203 +1872,141 @@ class ActorToActorApp:
         except Exception as e:
             print(f"Error finding actor by name: {str(e)}")
             return None
-    def _is_mcu_credit(self, credit_id):
-        """Check if a credit is from an MCU production"""
-        try:
-            if 'actors' in self.db_connections:
-                conn = sqlite3.connect(self.db_connections['actors']['path'])
-                cursor = conn.cursor()
-                
-                # Check in movie credits
-                cursor.execute("SELECT is_mcu FROM movie_credits WHERE id = ? LIMIT 1", (credit_id,))
-                result = cursor.fetchone()
-                if result:
-                    is_mcu = result[0] == 1
-                    conn.close()
-                    return is_mcu
-                    
-                # Check in TV credits
-                cursor.execute("SELECT is_mcu FROM tv_credits WHERE id = ? LIMIT 1", (credit_id,))
-                result = cursor.fetchone()
-                if result:
-                    is_mcu = result[0] == 1
-                    conn.close()
-                    return is_mcu
-                    
-                conn.close()
-        except Exception as e:
-            print(f"Error checking MCU status: {str(e)}")
-        
-        return False
     def _find_shortest_path(self, start_id, target_id, include_tv=True, exclude_mcu=False, max_depth=6):
-        """Find the shortest path between two actors with filters"""
+        """Find the shortest path between two actors with filters.
 
+        Runs on db_executor. The graph is built, searched and read for display
+        under _graph_lock, so a load or rebuild can't replace it part way.
+        """
+        with self._graph_lock:
+            if self._ensure_graph():
+                self._search_graph(start_id, target_id, include_tv, exclude_mcu)
+                return
+        self._post(lambda: self.loading_widgets.destroy() if hasattr(self, 'loading_widgets') else None)
+
+    def _search_graph(self, start_id, target_id, include_tv, exclude_mcu):
+        """Find a path in the loaded graph and show it; call with _graph_lock held"""
         try:
-            # First check if there's a pre-computed path in actor_connections
-            if 'actor_connections' in self.db_connections:
+            # First check for a pre-computed path; the pairs were read into
+            # memory with the graph, so a miss needs no query
+            pair = (start_id, target_id)
+            reverse = pair not in self.graph.precomputed
+            if reverse:
+                pair = (target_id, start_id)
+            
+            if pair in self.graph.precomputed:
                 try:
-                    conn = sqlite3.connect(self.db_connections['actor_connections']['path'])
-                    cursor = conn.cursor()
-                    # Check both directions
-                    cursor.execute("""
-                        SELECT optimal_path FROM actor_connections 
-                        WHERE (start_id = ? AND target_id = ?) OR (start_id = ? AND target_id = ?)
-                    """, (start_id, target_id, target_id, start_id))
-                    result = cursor.fetchone()
-                    conn.close()
+                    db_path = self.db_connections['actor_connections']['path']
+                    conn = self._acquire_db(db_path)
+                    try:
+                        row = conn.execute(SQL_PRECOMPUTED_PATH, (str(pair[0]), str(pair[1]))).fetchone()
+                    finally:
+                        self._release_db(db_path, conn)
                     
-                    if result:
+                    # The pair may have been deleted since the graph was
+                    # loaded; then the search below finds the path
+                    if row is not None:
                         # Pre-computed path needs validation
                         import gzip
                         import json
-                        path_data = gzip.decompress(result[0]).decode('utf-8')
-                        path_items = json.loads(path_data)
-                        
+                        path_items = json.loads(gzip.decompress(row[0]).decode('utf-8'))
+                        if reverse:
+                            path_items.reverse()
+                    
                         # Extract actor IDs and movie IDs for validation
-                        actor_path = []
-                        movie_ids = []
-                        
-                        for i, item in enumerate(path_items):
-                            if item['t'] == 'a':  # Actor
-                                actor_path.append(int(item['i']))
-                            elif item['t'] == 'm':  # Movie or TV show
-                                movie_ids.append(item['i'])
-                        
-                        # Verify each movie actually exists and connects the actors
-                        all_valid = True
-                        for i in range(len(movie_ids)):
-                            movie_id = movie_ids[i]
-                            actor1 = actor_path[i]
-                            actor2 = actor_path[i+1]
-                            
-                            # Check if this movie connects these actors
-                            if not self._verify_movie_connects_actors(movie_id, actor1, actor2, check_media_type=True):
-                                print(f"Invalid connection: Movie/Show {movie_id} doesn't connect actors")
-                                all_valid = False
-                                break
-                        
+                        actor_path = [int(item['i']) for item in path_items if item['t'] == 'a']
+                        movie_ids = [int(item['i']) for item in path_items if item['t'] == 'm']
+                    
+                        # Verify each movie connects its two actors in the loaded credits
+                        all_valid = len(movie_ids) == len(actor_path) - 1 and all(
+                            self.graph.shares_title(actor_path[i], actor_path[i+1], movie_id)
+                            for i, movie_id in enumerate(movie_ids)
+                        )
+                    
                         if all_valid:
                             # Clean up loading indicator and display path
-                            self.root.after(0, lambda: self.loading_widgets.destroy() if hasattr(self, 'loading_widgets') else None)
-                            self.root.after(0, lambda: self._display_path(actor_path))
+                            self._post(lambda: self.loading_widgets.destroy() if hasattr(self, 'loading_widgets') else None)
+                            links = [(movie_id, False) for movie_id in movie_ids]
+                            steps = self._describe_path(actor_path, links)
+                            self._post(lambda: self._display_path(actor_path, *steps))
                             return
                         # If not valid, fall through to regular path finding
                         print("Pre-computed path failed validation, trying regular path finding")
                 except Exception as e:
                     print(f"Error checking pre-computed path: {str(e)}")
 
-            # Create a filtered copy of the graph based on the search settings
-            filtered_graph = self.graph.copy()
-            
-            # Filter out TV show connections if include_tv is False
-            if not include_tv:
-                edges_to_remove = []
-                for u, v, data in filtered_graph.edges(data=True):
-                    if data.get('connection_type') == 'tv':
-                        edges_to_remove.append((u, v))
-                filtered_graph.remove_edges_from(edges_to_remove)
-                print(f"Removed {len(edges_to_remove)} TV connections from search")
-                            
-            # Filter out MCU connections if exclude_mcu is True
-            if exclude_mcu:
-                edges_to_remove = []
-                for u, v, data in filtered_graph.edges(data=True):
-                    for credit_id in data.get('credits', []):
-                        # Check if this is an MCU movie/show
-                        if self._is_mcu_credit(credit_id):
-                            edges_to_remove.append((u, v))
-                            break
-                filtered_graph.remove_edges_from(edges_to_remove)
-                print(f"Removed {len(edges_to_remove)} MCU connections from search")
-                
-            # Verify all connections have actual movies/shows in the database
-            verified_graph = self._verify_connections(filtered_graph)
-            if verified_graph.number_of_edges() < filtered_graph.number_of_edges():
-                print(f"Removed {filtered_graph.number_of_edges() - verified_graph.number_of_edges()} unverified connections")
-            
-            # Fall back to calculating path using NetworkX
-            try:
-                # Try to find path in the verified graph first
-                path = nx.shortest_path(verified_graph, source=start_id, target=target_id)
-                print("Found path in verified graph")
-            except nx.NetworkXNoPath:
+            # TV-only and MCU edges are masked inside the search. Every co-star
+            # edge comes from a credit row, so there is nothing left to verify.
+            result = self.graph.shortest_path(start_id, target_id,
+                                              include_tv=include_tv, exclude_mcu=exclude_mcu)
+            if result is None:
                 # No path found with verified connections
                 # Clean up loading indicator
-                self.root.after(0, lambda: self.loading_widgets.destroy() if hasattr(self, 'loading_widgets') else None)
-                self.root.after(0, lambda: self.status_var.set("No verified path found between these actors"))
+                self._post(lambda: self.loading_widgets.destroy() if hasattr(self, 'loading_widgets') else None)
+                self._post(lambda: self.status_var.set("No verified path found between these actors"))
                 return
             
             # Clean up loading indicator in the main thread
-            self.root.after(0, lambda: self.loading_widgets.destroy() if hasattr(self, 'loading_widgets') else None)
+            self._post(lambda: self.loading_widgets.destroy() if hasattr(self, 'loading_widgets') else None)
             
             # Display the path
-            self.root.after(0, lambda: self._display_path(path))
-        except nx.NetworkXNoPath:
-            # Clean up loading indicator
-            self.root.after(0, lambda: self.loading_widgets.destroy() if hasattr(self, 'loading_widgets') else None)
-            
-            # Create "No Connection" display
-            self.root.after(0, lambda: self._display_no_connection(start_id, target_id))
+            path, links = result
+            steps = self._describe_path(path, links)
+            self._post(lambda: self._display_path(path, *steps))
         except Exception as e:
             # Clean up loading indicator
-            self.root.after(0, lambda: self.loading_widgets.destroy() if hasattr(self, 'loading_widgets') else None)
+            self._post(lambda: self.loading_widgets.destroy() if hasattr(self, 'loading_widgets') else None)
             print(f"Error finding shortest path: {str(e)}")
             
             # Fix the lambda issue
             error_msg = f"Error finding path: {str(e)}"
-            self.root.after(0, lambda msg=error_msg: self.status_var.set(msg))
+            self._post(lambda msg=error_msg: self.status_var.set(msg))
 
-    def _verify_connections(self, graph):
-        """Verify all connections have actual movies or TV shows in the database"""
-        verified_graph = graph.copy()
-        edges_to_remove = []
-        
-        if 'actors' not in self.db_connections:
-            # Can't verify without the actors database
-            return verified_graph
-        
-        conn = sqlite3.connect(self.db_connections['actors']['path'])
-        cursor = conn.cursor()
-        
-        for actor1, actor2, data in graph.edges(data=True):
-            valid_edge = False
-            if 'credits' in data:
-                for credit_id in data['credits']:
-                    # Check if this credit exists in either movie_credits or tv_credits
-                    cursor.execute("SELECT 1 FROM movie_credits WHERE id = ? LIMIT 1", (credit_id,))
-                    if cursor.fetchone():
-                        valid_edge = True
-                        break
-                    
-                    cursor.execute("SELECT 1 FROM tv_credits WHERE id = ? LIMIT 1", (credit_id,))
-                    if cursor.fetchone():
-                        valid_edge = True
-                        break
-            
-            if not valid_edge:
-                edges_to_remove.append((actor1, actor2))
-        
-        conn.close()
+    def _describe_path(self, path, links):
+        """(names, profile paths, title labels) for showing a path: the name
+        and profile image of each actor and the title linking each pair.
+
+        Reads the graph, so it runs on the search worker with _graph_lock
+        held. links[i] is the (credit_id, is_tv) connecting path[i] and
+        path[i + 1]; without it any title the two actors share is shown.
+        """
+        names, profile_paths = [], []
+        for actor_id in path:
+            if self.graph.has_node(actor_id):
+                names.append(self.graph.nodes[actor_id].get('name', f"Actor {actor_id}"))
+                profile_paths.append(self.graph.nodes[actor_id].get('profile_path'))
+            else:
+                names.append(f"Unknown Actor {actor_id}")
+                profile_paths.append(None)
+        
+        # Get the title connecting each pair of actors, from the search or the graph
+        step_links = [links[i] if links else self.graph.shared_title(path[i], path[i + 1])
+                      for i in range(len(path) - 1)]
+        
+        # Title labels are kept with the graph, so only titles no earlier path
+        # has shown are looked up, all on one connection
+        missing = {link for link in step_links if link is not None and link not in self.graph.title_labels}
+        if missing and 'actors' in self.db_connections:
+            db_path = self.db_connections['actors']['path']
+            conn = self._acquire_db(db_path)
+            cursor = conn.cursor()
+            for link in missing:
+                try:
+                    self.graph.title_labels[link] = self._link_title(cursor, *link)
+                except Exception as e:
+                    print(f"Error finding credit: {str(e)}")
+            self._release_db(db_path, conn)
         
-        # Remove all unverified edges
-        verified_graph.remove_edges_from(edges_to_remove)
-        return verified_graph
+        titles = [None if link is None else self.graph.title_labels.get(link, "Unknown Movie")
+                  for link in step_links]
+        return names, profile_paths, titles
 
-    def _display_path(self, path):
-        """Display the found actor path in the UI"""
+    def _display_path(self, path, actor_names, profile_paths, titles):
+        """Display the found actor path in the UI, as described by _describe_path"""
         if not path or len(path) < 2:
             self.status_var.set("Invalid path found")
             return
         
-        # Get actor names for the path
-        actor_names = []
-        for actor_id in path:
-            if self.graph.has_node(actor_id):
-                name = self.graph.nodes[actor_id].get('name', f"Actor {actor_id}")
-                actor_names.append(name)
-            else:
-                actor_names.append(f"Unknown Actor {actor_id}")
-        
         # Calculate correct connection count - the number of INTERMEDIARY actors
         # If two actors are direct co-stars, that's 0 connections
         # If there's one actor between them, that's 1 connection, etc.
@@ -1332,111 +2025,48 @@ class ActorToActorApp:
         self.status_var.set(f"Found path with {connection_text}")
         
         # Clear previous visual path
-        for widget in self.path_frame.winfo_children():
-            widget.destroy()
+        self._clear_path_frame()
         
-        # Add visual representation of the path
+        # Add visual representation of the path, reusing the widgets of earlier searches
         for i, actor_id in enumerate(path):
+            arrow_label, movie_frame, movie_label, actor_frame, img_label, name_label = self._path_step_widgets(i)
             if i > 0:
                 # Add arrow between actors
-                arrow_label = ttk.Label(self.path_frame, text="→")
                 arrow_label.pack(side=tk.LEFT, padx=5)
                 
-                # Try to find movie that connects these actors
-                actor1 = path[i-1]
-                actor2 = actor_id
-                
-                # Get movie connections if they exist in the graph
-                if self.graph.has_edge(actor1, actor2):
-                    movie_frame = ttk.Frame(self.path_frame)
+                # Show the movie that connects these actors
+                movie_title = titles[i-1]
+                if movie_title is not None:
                     movie_frame.pack(side=tk.LEFT, padx=5)
-                    movie_title = "Unknown Movie"
-                    
-                    # Check for credits in the edge data
-                    if 'credits' in self.graph[actor1][actor2]:
-                        credit_id = self.graph[actor1][actor2]['credits'][0]
-                        
-                        # Try to find the movie/show title
-                        if 'actors' in self.db_connections:
-                            try:
-                                conn = sqlite3.connect(self.db_connections['actors']['path'])
-                                cursor = conn.cursor()
-                                
-                                # First check if these actors are actually connected by this credit
-                                cursor.execute("""
-                                    SELECT COUNT(*) FROM movie_credits 
-                                    WHERE id = ? AND actor_id = ?
-                                """, (credit_id, actor1))
-                                actor1_in_movie = cursor.fetchone()[0] > 0
-                                
-                                cursor.execute("""
-                                    SELECT COUNT(*) FROM movie_credits 
-                                    WHERE id = ? AND actor_id = ?
-                                """, (credit_id, actor2))
-                                actor2_in_movie = cursor.fetchone()[0] > 0
-                                
-                                # If both actors are in this movie
-                                if actor1_in_movie and actor2_in_movie:
-                                    cursor.execute("SELECT title FROM movie_credits WHERE id = ? LIMIT 1", (credit_id,))
-                                    result = cursor.fetchone()
-                                    if result:
-                                        movie_title = f"🎬 {result[0]}"
-                                else:
-                                    # Check TV credits
-                                    cursor.execute("""
-                                        SELECT COUNT(*) FROM tv_credits 
-                                        WHERE id = ? AND actor_id = ?
-                                    """, (credit_id, actor1))
-                                    actor1_in_tv = cursor.fetchone()[0] > 0
-                                    
-                                    cursor.execute("""
-                                        SELECT COUNT(*) FROM tv_credits 
-                                        WHERE id = ? AND actor_id = ?
-                                    """, (credit_id, actor2))
-                                    actor2_in_tv = cursor.fetchone()[0] > 0
-                                    
-                                    # If both actors are in this TV show
-                                    if actor1_in_tv and actor2_in_tv:
-                                        cursor.execute("SELECT name FROM tv_credits WHERE id = ? LIMIT 1", (credit_id,))
-                                        result = cursor.fetchone()
-                                        if result:
-                                            movie_title = f"📺 {result[0]}"
-                                            # Add note about different episodes for TV shows
-                                            movie_title += "\n(different episodes)"
-                                            
-                            except Exception as e:
-                                print(f"Error finding credit: {str(e)}")
-                    
-                    ttk.Label(movie_frame, text=f"in\n{movie_title}", font=("TkDefaultFont", 8), 
-                             justify=tk.CENTER, wraplength=100).pack()
+                    movie_label.configure(text=f"in\n{movie_title}")
             
             # Add actor box
-            actor_frame = ttk.Frame(self.path_frame, borderwidth=2, relief=tk.GROOVE, padding=5)
             actor_frame.pack(side=tk.LEFT, padx=5, pady=10)
+            photo = None
+            name, profile_path = actor_names[i], profile_paths[i]
             
-            if self.graph.has_node(actor_id):
-                name = self.graph.nodes[actor_id].get('name', f"Actor {actor_id}")
+            # Show the image if cached, otherwise fetch it in the background
+            # and show it when it arrives instead of blocking the whole path
+            if profile_path:
+                photo = self._get_cached_image(profile_path, (50, 75))
+                if photo is None:
+                    future = self.image_executor.submit(
+                        self._fetch_thumbnail, f"https://image.tmdb.org/t/p/w92{profile_path}", (50, 75))
+                    future.add_done_callback(
+                        lambda f, label=img_label, above=name_label, path=profile_path:
+                            self._post(self._show_path_image, label, above, path, f))
+            
+            # A reused widget may still be waiting on an earlier search's image
+            img_label.pending_profile = profile_path if photo is None else None
                 
-                # Try to load image if available
-                profile_path = self.graph.nodes[actor_id].get('profile_path')
-                if profile_path:
-                    image_url = f"https://image.tmdb.org/t/p/w92{profile_path}"
-                    try:
-                        response = requests.get(image_url, timeout=3)
-                        if response.status_code == 200:
-                            img = Image.open(io.BytesIO(response.content))
-                            img.thumbnail((50, 75))
-                            photo = ImageTk.PhotoImage(img)
-                            img_label = ttk.Label(actor_frame, image=photo)
-                            img_label.image = photo  # Keep a reference
-                            img_label.pack(padx=5, pady=5)
-                    except Exception as e:
-                        print(f"Error loading actor image: {str(e)}")
+            name_label.configure(text=name)
+            name_label.pack(padx=5, pady=5)
+            if photo is not None:
+                img_label.configure(image=photo)
+                img_label.image = photo  # Keep a reference
+                img_label.pack(padx=5, pady=5, before=name_label)
             else:
-                name = f"Unknown Actor {actor_id}"
-                
-            ttk.Label(actor_frame, text=name, font=("TkDefaultFont", 9, "bold"), 
-                     wraplength=120, justify=tk.CENTER).pack(padx=5, pady=5)
+                img_label.pack_forget()
         
         # Update the canvas scroll region
         self.path_frame.update_idletasks()
@@ -1445,76 +2075,143 @@ class ActorToActorApp:
         # Scroll to the beginning
         self.path_canvas.xview_moveto(0)
 
+    def _show_path_image(self, img_label, name_label, profile_path, future):
+        """Show a path step's image once its background download finishes"""
+        if self._show_fetched_image(img_label, profile_path, (50, 75), future) is not None:
+            img_label.pack(padx=5, pady=5, before=name_label)
+            self.path_frame.update_idletasks()
+            self.path_canvas.configure(scrollregion=self.path_canvas.bbox("all"))
+
+    def _link_title(self, cursor, credit_id, is_tv):
+        """Label for the movie or TV show linking two actors on a path"""
+        if is_tv:
+            cursor.execute("SELECT name FROM tv_credits WHERE id = ? LIMIT 1", (credit_id,))
+            result = cursor.fetchone()
+            # Add note about different episodes for TV shows
+            return f"📺 {result[0]}\n(different episodes)" if result else "Unknown Movie"
+        
+        cursor.execute("SELECT title FROM movie_credits WHERE id = ? LIMIT 1", (credit_id,))
+        result = cursor.fetchone()
+        return f"🎬 {result[0]}" if result else "Unknown Movie"
+
+    def _path_step_widgets(self, i):
+        """(arrow, title frame, title label, actor frame, image label, name label)
+        for step i of the visual path.
+
+        Steps are created on first use and kept in a pool, so later searches
+        reconfigure existing widgets instead of destroying and recreating them.
+        """
+        while len(self._path_widget_pool) <= i:
+            arrow_label = ttk.Label(self.path_frame, text="→")
+            movie_frame = ttk.Frame(self.path_frame)
+            movie_label = ttk.Label(movie_frame, font=("TkDefaultFont", 8),
+                                    justify=tk.CENTER, wraplength=100)
+            movie_label.pack()
+            actor_frame = ttk.Frame(self.path_frame, borderwidth=2, relief=tk.GROOVE, padding=5)
+            img_label = ttk.Label(actor_frame)
+            name_label = ttk.Label(actor_frame, font=("TkDefaultFont", 9, "bold"),
+                                   wraplength=120, justify=tk.CENTER)
+            self._path_widget_pool.append((arrow_label, movie_frame, movie_label,
+                                           actor_frame, img_label, name_label))
+        return self._path_widget_pool[i]
+
+    def _clear_path_frame(self):
+        """Hide the pooled path widgets and destroy anything else in the path
+        frame (loading indicator, no-connection message)"""
+        pooled = set()
+        for arrow_label, movie_frame, _, actor_frame, _, _ in self._path_widget_pool:
+            for widget in (arrow_label, movie_frame, actor_frame):
+                widget.pack_forget()
+                pooled.add(widget)
+        for widget in self.path_frame.winfo_children():
+            if widget not in pooled:
+                widget.destroy()
+
     def update_stats(self):
         """Update the statistics displayed in the stats tab with current database information"""
-        # Update database path info
+        self._show_stats(self._query_stats())
+
+    def _query_stats(self):
+        """(actor_count, movie_count, tv_count, top_actors) for the stats tab.
+
+        Only reads SQLite, so it is safe to run off the Tk thread. The media
+        counts are display strings since they may be an N/A note instead.
+        """
+        # The counts only change with the database file, so refreshing an
+        # unchanged database reuses them instead of recounting every credit
+        stats_key = None
         if 'actors' in self.db_connections:
-            self.db_path_var.set(self.db_connections['actors']['path'])
-            self.db_size_var.set(self.db_connections['actors']['size'])
-        elif self.db_connections:
-            # Use the first available database if actors.db not found
-            first_db = next(iter(self.db_connections.values()))
-            self.db_path_var.set(first_db['path'])
-            self.db_size_var.set(first_db['size'])
-        else:
-            self.db_path_var.set("Not loaded")
-            self.db_size_var.set("")
-        
-        # Update actor count
-        actor_count = len([n for n, d in self.graph.nodes(data=True) if d.get('type') == 'actor'])
-        if actor_count > 0:
-            self.actor_count_var.set(f"{actor_count:,}")
-        else:
-            self.actor_count_var.set("0")
-        
-        # Update movie and TV show counts if available
+            stats_key = (self.db_connections['actors']['path'], self._graph_database_mtimes().get('actors'))
+            if self._stats_cache is not None and self._stats_cache[0] == stats_key:
+                return self._stats_cache[1]
+
+        actor_count = 0
+        movie_count = tv_count = "N/A (actors database not found)"
+        top_actors = []
         try:
             if 'actors' in self.db_connections:
-                conn = sqlite3.connect(self.db_connections['actors']['path'])
+                conn = self._acquire_db(self.db_connections['actors']['path'])
                 cursor = conn.cursor()
+
+                if 'actors' in self.db_connections['actors']['tables']:
+                    cursor.execute(SQL_ACTOR_COUNT)
+                    actor_count = cursor.fetchone()[0]
+                    cursor.execute(SQL_TOP_ACTORS)
+                    top_actors = cursor.fetchall()
                 
                 # Try to get movie count - NOTE: Changed table name from 'movies' to 'movie_credits'
                 if 'movie_credits' in self.db_connections['actors']['tables']:
                     cursor.execute("SELECT COUNT(DISTINCT id) FROM movie_credits")
-                    movie_count = cursor.fetchone()[0]
-                    self.movie_count_var.set(f"{movie_count:,}")
+                    movie_count = f"{cursor.fetchone()[0]:,}"
                 else:
-                    self.movie_count_var.set("N/A (no movie_credits table)")
+                    movie_count = "N/A (no movie_credits table)"
                 
                 # Try to get TV show count - NOTE: Changed table name from 'tv_shows' to 'tv_credits'
                 if 'tv_credits' in self.db_connections['actors']['tables']:
                     cursor.execute("SELECT COUNT(DISTINCT id) FROM tv_credits")
-                    tv_count = cursor.fetchone()[0]
-                    self.tv_count_var.set(f"{tv_count:,}")
+                    tv_count = f"{cursor.fetchone()[0]:,}"
                 else:
-                    self.tv_count_var.set("N/A (no tv_credits table)")
+                    tv_count = "N/A (no tv_credits table)"
                 
-                conn.close()
-            else:
-                self.movie_count_var.set("N/A (actors database not found)")
-                self.tv_count_var.set("N/A (actors database not found)")
+                self._release_db(self.db_connections['actors']['path'], conn)
         except Exception as e:
-            self.movie_count_var.set("Error querying")
-            self.tv_count_var.set("Error querying")
+            movie_count = tv_count = "Error querying"
             print(f"Error updating media counts: {str(e)}")
+            stats_key = None
+
+        stats = actor_count, movie_count, tv_count, top_actors
+        if stats_key is not None:
+            self._stats_cache = (stats_key, stats)
+        return stats
+
+    def _show_stats(self, stats):
+        """Fill the stats tab with the result of _query_stats"""
+        actor_count, movie_count, tv_count, top_actors = stats
+
+        # Update database path info
+        if 'actors' in self.db_connections:
+            self.db_path_var.set(self.db_connections['actors']['path'])
+            self.db_size_var.set(self.db_connections['actors']['size'])
+        elif self.db_connections:
+            # Use the first available database if actors.db not found
+            first_db = next(iter(self.db_connections.values()))
+            self.db_path_var.set(first_db['path'])
+            self.db_size_var.set(first_db['size'])
+        else:
+            self.db_path_var.set("Not loaded")
+            self.db_size_var.set("")
         
-        # Update popular actors list
-        self.top_actors_tree.delete(*self.top_actors_tree.get_children())
-        
-        # Get all actors with popularity info
-        actors_with_pop = [(n, d.get('name', 'Unknown'), d.get('popularity', 0))
-                          for n, d in self.graph.nodes(data=True) 
-                          if d.get('type') == 'actor' and d.get('popularity')]
-        
-        # Sort by popularity (descending)
-        actors_with_pop.sort(key=lambda x: x[2], reverse=True)
+        self.actor_count_var.set(f"{actor_count:,}")
+        self.movie_count_var.set(movie_count)
+        self.tv_count_var.set(tv_count)
         
-        # Add top actors to tree
-        for i, (actor_id, name, popularity) in enumerate(actors_with_pop[:100], 1):
-            self.top_actors_tree.insert("", "end", values=(i, actor_id, name, f"{popularity:.1f}"))
+        # Update popular actors list (top 100 by popularity, already sorted by SQL)
+        self.top_actors_tree.delete(*self.top_actors_tree.get_children())
+        _bulk_insert(self.top_actors_tree, [(i, actor_id, name or 'Unknown', f"{popularity:.1f}")
+                                            for i, (actor_id, name, popularity) in enumerate(top_actors, 1)])
         
         # Display diagnostic info in status bar
-        self.status_var.set(f"Stats updated. {actor_count} actors loaded in graph.")
+        self.status_var.set(f"Stats updated. {actor_count} actors in database.")
 
     def open_database(self):
         filename = filedialog.askopenfilename(
@@ -1575,9 +2272,7 @@ class ActorToActorApp:
     
     def threaded_load_actor_credits(self, actor_id, selected_db, db_path, credits_tree, status_var):
         # Method to load actor credits in a background thread
-        threading.Thread(target=self._load_credits_task, 
-                       args=(actor_id, selected_db, db_path, credits_tree, status_var),
-                       daemon=True).start()
+        self.db_executor.submit(self._load_credits_task, actor_id, selected_db, db_path, credits_tree, status_var)
     
     def _load_credits_task(self, actor_id, selected_db, db_path, credits_tree, status_var):
         # Background task implementation
@@ -1653,7 +2348,7 @@ class ActorToActorApp:
             
             try:
                 db_path = self.db_connections[selected_db]['path']
-                conn = sqlite3.connect(db_path)
+                conn = _connect(db_path)
                 cursor = conn.cursor()
                 cursor.execute(sql)
                 
@@ -1666,8 +2361,7 @@ class ActorToActorApp:
                     results_tree.column(col, width=100)
                 
                 # Add data rows
-                for row in cursor.fetchall():
-                    results_tree.insert("", "end", values=row)
+                _bulk_insert(results_tree, cursor.fetchall())
                 
                 conn.close()
             except Exception as e:
@@ -1749,21 +2443,13 @@ class ActorToActorApp:
         tree.bind("<Double-1>", lambda e: select_actor())
         
         # Populate with search results
-        conn = sqlite3.connect(self.db_connections['actors']['path'])
+        db_path = self.db_connections['actors']['path']
+        conn = self._acquire_db(db_path)
         cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id, name, popularity 
-            FROM actors 
-            WHERE name LIKE ? 
-            ORDER BY popularity DESC
-            LIMIT 100
-        """, (f"%{name}%",))
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        for actor_id, name, popularity in results:
-            tree.insert("", "end", values=(actor_id, name, f"{popularity:.1f}"))
+        results = self._search_actors_by_name(cursor, db_path, name)
+        self._release_db(db_path, conn)
+        
+        _bulk_insert(tree, [(actor_id, name, f"{popularity:.1f}") for actor_id, name, popularity in results])
             
         # If results found, select the first one
         if tree.get_children():
@@ -1780,9 +2466,7 @@ class ActorToActorApp:
         actor2_name = self.graph.nodes[actor2_id]['name'] if actor2_id in self.graph else f"Actor {actor2_id}"
         
         # Clear previous visual path
-        for widget in self.path_frame.winfo_children():
-            widget.destroy()
-            
+        self._clear_path_frame()
                    
         # Show the actors with a broken connection symbol between
         frame1 = ttk.Frame(self.path_frame, borderwidth=2, relief=tk.GROOVE)
@@ -1799,56 +2483,6 @@ class ActorToActorApp:
         ttk.Label(frame2, text=actor2_name, font=("TkDefaultFont", 10, "bold")).pack(padx=5, pady=5)
         
         self.status_var.set(f"No valid connection found between {actor1_name} and {actor2_name}")
-
-    def _verify_movie_connects_actors(self, movie_id, actor1_id, actor2_id, check_media_type=False):
-        """Verify that a movie/TV show actually connects two actors"""
-        try:
-            if 'actors' not in self.db_connections:
-                return False  # Can't verify without database
-                
-            conn = sqlite3.connect(self.db_connections['actors']['path'])
-            cursor = conn.cursor()
-            
-            # First check if both actors appear in this as a movie
-            cursor.execute("""
-                SELECT COUNT(*) FROM movie_credits 
-                WHERE id = ? AND actor_id = ?
-            """, (movie_id, actor1_id))
-            actor1_in_movie = cursor.fetchone()[0] > 0
-            
-            if actor1_in_movie:
-                # If actor1 is in movie, actor2 must also be in movie (not TV)
-                cursor.execute("""
-                    SELECT COUNT(*) FROM movie_credits 
-                    WHERE id = ? AND actor_id = ?
-                """, (movie_id, actor2_id))
-                movie_result = cursor.fetchone()[0] > 0
-                conn.close()
-                return movie_result
-            
-            # Try TV shows if movie check failed
-            cursor.execute("""
-                SELECT COUNT(*) FROM tv_credits 
-                WHERE id = ? AND actor_id = ?
-            """, (movie_id, actor1_id))
-            actor1_in_tv = cursor.fetchone()[0] > 0
-            
-            if actor1_in_tv:
-                # If actor1 is in TV show, actor2 must also be in same show
-                cursor.execute("""
-                    SELECT COUNT(*) FROM tv_credits 
-                    WHERE id = ? AND actor_id = ?
-                """, (movie_id, actor2_id))
-                tv_result = cursor.fetchone()[0] > 0
-                conn.close()
-                return tv_result if not check_media_type else False
-                
-            conn.close()
-            return False
-            
-        except Exception as e:
-            print(f"Error verifying connection: {str(e)}")
-            return False
         
 def main():
     root = tk.Tk()
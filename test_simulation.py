@@ -33,27 +33,29 @@ def load_graph():
 
 def shortest_path(graph, start, target, max_depth=10):
     if start == target:
-        return [start]
+        return [start], 0
     visited = {start: None}
     q = deque([start])
     depth = 0
     nodes_visited = 0
-    while q and depth <= max_depth:
+    # The target is checked as it is enqueued, so the search stops a whole
+    # layer earlier than waiting for it to be dequeued
+    while q and depth < max_depth:
         level_size = len(q)
         for _ in range(level_size):
             current = q.popleft()
             nodes_visited += 1
-            if current == target:
-                path = []
-                node = target
-                while node is not None:
-                    path.append(node)
-                    node = visited[node]
-                path.reverse()
-                return path, nodes_visited
             for neighbor in graph.get(current, set()):
                 if neighbor not in visited:
                     visited[neighbor] = current
+                    if neighbor == target:
+                        path = []
+                        node = target
+                        while node is not None:
+                            path.append(node)
+                            node = visited[node]
+                        path.reverse()
+                        return path, nodes_visited
                     q.append(neighbor)
         depth += 1
     return None, nodes_visited
@@ -1571,6 +1571,9 @@ cursor.execute("CREATE INDEX idx_tv_credits_actor ON tv_credits (actor_id)")
 cursor.execute("CREATE INDEX idx_tv_credits_mcu ON tv_credits (is_mcu)")
 cursor.execute("CREATE INDEX idx_actor_regions ON actor_regions (region)")
 
+# Gather planner statistics so credit self-joins use the right index
+cursor.execute("ANALYZE")
+
 # Optimize database
 cursor.execute("VACUUM")
 conn.commit()